@@ -17,108 +17,216 @@
 # All configuration values have a default; values that are commented out
 # serve to show the default.
 
+import hashlib
+import json
 import os
 import re
 import reactions
 import shutil
 import subprocess
 import sys
-import tempfile
 import time
+import urllib.request
 import warnings
 
+from pathlib import Path
+
 # If extensions (or modules to document with autodoc) are in another directory,
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
 sys.path.insert(0, os.path.dirname(os.path.abspath(reactions.__file__)))
 
+# Version of the package, used in several places of this file
+reactions_version = reactions.__version__
+
+# Versions of ReadTheDocs builds for which the changelog is available
+_VERSION_RE = re.compile(r'^(v\d+\.\d+\.\d+|stable)$')
+
+
+def file_hashes(directory):
+    """ Compute the hash of the contents of the files in a directory """
+    out = {}
+    for path, _, files in os.walk(directory):
+        for f in files:
+            fp = os.path.join(path, f)
+            with open(fp, 'rb') as fi:
+                out[fp] = hashlib.md5(fi.read()).hexdigest()
+    return out
+
+
+def walk_mtimes(directory):
+    """ Get the modification times of the files in a directory, recursively """
+    out = {}
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    out[entry.path] = entry.stat().st_mtime_ns
+    return out
+
+
 # Generate the doxygen files for the C++ documentation. The Doxyfile in the
-# root directory is copied to a temporary location and the version and output
-# directories are modified according to the needs of Sphinx.
-with tempfile.TemporaryDirectory() as tmpdir:
+# root directory is copied to a persistent cache directory and the version and
+# output directories are modified according to the needs of Sphinx. Doxygen is
+# only executed if any of its inputs changed since the last build.
+source_dir = Path(__file__).resolve().parent
+root = source_dir.parents[1]
 
-    # Install the C++ static files
-    root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+auxiliar_dir = source_dir / 'auxiliar'
 
-    ori_doxyfile = os.path.join(root, 'docs', 'Doxyfile')
-    tmp_doxyfile = os.path.join(tmpdir, 'Doxyfile')
+intro_file = auxiliar_dir / 'CPP_INTRODUCTION.md'
 
-    shutil.copyfile(ori_doxyfile, tmp_doxyfile)
+static_doc_dir = source_dir / '_static'
+cpp_doc_dir = static_doc_dir / 'cpp'
 
-    auxiliar_dir = os.path.join(root, 'docs', 'source', 'auxiliar')
+cache_dir = source_dir / '_doxygen_cache'
+cache_dir.mkdir(exist_ok=True)
 
-    intro_file = os.path.join(auxiliar_dir, 'CPP_INTRODUCTION.md')
+ori_doxyfile = root / 'docs' / 'Doxyfile'
+cache_doxyfile = cache_dir / 'Doxyfile'
+cache_mtimes = cache_dir / 'mtimes.json'
 
-    static_doc_dir = os.path.join(os.path.dirname(__file__), '_static')
-    cpp_doc_dir = os.path.join(static_doc_dir, 'cpp')
+shutil.copyfile(ori_doxyfile, cache_doxyfile)
 
-    with open(tmp_doxyfile, 'at') as df:
-        df.write(f'''
-TAGFILES = {os.path.join(static_doc_dir, "cppreference-doxygen-web.tag.xml=http://en.cppreference.com/w/")}
-INPUT = {intro_file} {os.path.join(root, "include")}
+with open(cache_doxyfile, 'at') as df:
+    df.write(f'''
+TAGFILES = {static_doc_dir / "cppreference-doxygen-web.tag.xml"}=http://en.cppreference.com/w/
+INPUT = {intro_file} {root / "include"}
 USE_MDFILE_AS_MAINPAGE = {intro_file}
-PROJECT_NUMBER = {reactions.__version__}
+PROJECT_NUMBER = {reactions_version}
 OUTPUT_DIRECTORY = {cpp_doc_dir}
 ''')
-    subprocess.check_call(['doxygen'], cwd=tmpdir)
 
-    # This part is only executed if we are not on a lazy build
-    if os.getenv('REACTIONS_SPHINX_LAZY_BUILD', None) is None:
+# modification times of the inputs of doxygen
+mtimes = {'version': reactions_version}
+mtimes.update(walk_mtimes(str(root / 'include')))
+for fp in ori_doxyfile, intro_file:
+    mtimes[str(fp)] = fp.stat().st_mtime_ns
+
+if cache_mtimes.exists():
+    with open(cache_mtimes) as f:
+        previous_mtimes = json.load(f)
+else:
+    previous_mtimes = None
+
+# Doxygen runs in the background while the rest of the documents are generated
+if mtimes != previous_mtimes or not cpp_doc_dir.is_dir():
+
+    # keep the modification times of the files that do not change, so the
+    # incremental builds of Sphinx are not invalidated
+    previous_hashes = file_hashes(cpp_doc_dir)
+    previous_stats = {fp: os.stat(fp) for fp in previous_hashes}
+
+    doxygen_process = subprocess.Popen(['doxygen'], cwd=cache_dir)
+else:
+    doxygen_process = None
 
-        # Generate additional documents needed by the documentation, like tables, plots, ...
-        auxiliar_tmp_dir = os.path.join(auxiliar_dir, 'tmp')
+# Processes running in the background, besides doxygen
+processes = []
 
-        os.makedirs(auxiliar_tmp_dir, exist_ok=True)
+# This part is only executed if we are not on a lazy build
+if os.getenv('REACTIONS_SPHINX_LAZY_BUILD', None) is None:
 
-        # If this is executed by ReadTheDocs (READTHEDOCS_VERSION is set), the changelog
-        # from the current version is used. This also works for the "stable" version. For
-        # other builds, like "latest", no changelog is used. If we are running a local
-        # build, the changelog is generated locally.
-        tmp_changelog = os.path.join(tmpdir, 'changelog.md')
+    # Generate additional documents needed by the documentation, like tables, plots, ...
+    auxiliar_tmp_dir = auxiliar_dir / 'tmp'
 
-        version_tag = os.environ.get(
-            'READTHEDOCS_VERSION', None)  # set by ReadTheDocs
+    auxiliar_tmp_dir.mkdir(exist_ok=True)
 
-        print(f'ReadTheDocs build version: {version_tag}')
+    # The tables are independent, so they are generated in parallel with the
+    # rest of the steps. They are only generated if the database or the script
+    # are newer than the output.
+    display_table_script = root / 'scripts' / 'display-table.py'
 
-        if version_tag and re.compile('^(v[0-9]*\.[0-9]*\.[0-9]|stable)$').match(version_tag):
+    for kind, database in ('pdg', reactions.pdg_database), ('nubase', reactions.nubase_database):
 
-            if version_tag != 'stable' and version_tag != f'v{reactions.__version__}':
-                raise RuntimeError(
-                    f'Tag version "{version_tag}" is different from the package version "v{reactions.__version__}"')
+        output = static_doc_dir / f'{kind}_table.pdf'
 
+        if output.exists() and output.stat().st_mtime >= max(os.path.getmtime(database.get_database_path()), display_table_script.stat().st_mtime):
+            continue
+
+        processes.append(subprocess.Popen(
+            ['python', display_table_script, kind, '--output', output]))
+
+    # If this is executed by ReadTheDocs (READTHEDOCS_VERSION is set), the changelog
+    # from the current version is used. This also works for the "stable" version. For
+    # other builds, like "latest", no changelog is used. If we are running a local
+    # build, the changelog is generated locally. The downloaded changelog is kept
+    # in the auxiliar directory so it is not requested again in later builds.
+    tmp_changelog = auxiliar_tmp_dir / f'v{reactions_version}-full-changelog.md'
+    changelog_rst = auxiliar_tmp_dir / 'changelog.rst'
+
+    def convert_changelog():
+        """ Convert the changelog to reStructuredText if it has changed """
+        if not changelog_rst.exists() or tmp_changelog.stat().st_mtime > changelog_rst.stat().st_mtime:
+            subprocess.check_call(
+                ['pandoc', tmp_changelog, '-o', changelog_rst])
+
+    version_tag = os.environ.get(
+        'READTHEDOCS_VERSION', None)  # set by ReadTheDocs
+
+    print(f'ReadTheDocs build version: {version_tag}')
+
+    if version_tag and _VERSION_RE.match(version_tag):
+
+        if version_tag != 'stable' and version_tag != f'v{reactions_version}':
+            raise RuntimeError(
+                f'Tag version "{version_tag}" is different from the package version "v{reactions_version}"')
+
+        if tmp_changelog.exists() and tmp_changelog.stat().st_size > 0:
+            sc = 0  # already downloaded
+        else:
+            url = f'https://github.com/mramospe/reactions/releases/download/v{reactions_version}/v{reactions_version}-full-changelog.md'
+            # the file is renamed once complete so a broken download is not kept
+            partial_changelog = tmp_changelog.with_suffix('.part')
             timeout = 3600  # 1 hour
             start = time.time()
             while time.time() - start < timeout:
-                sc = subprocess.call(
-                    ['wget', f'https://github.com/mramospe/reactions/releases/download/v{reactions.__version__}/v{reactions.__version__}-full-changelog.md', '-O', tmp_changelog])
-                if sc == 0:
+                try:
+                    with urllib.request.urlopen(url, timeout=30) as r, open(partial_changelog, 'wb') as f:
+                        shutil.copyfileobj(r, f)
+                    partial_changelog.replace(tmp_changelog)
+                    sc = 0
                     break
-                else:
+                except OSError as e:  # includes urllib.error.URLError
+                    print(f'Unable to download the changelog: {e}')
+                    sc = 1
                     time.sleep(30)  # wait 30 seconds
 
-            if sc != 0:
-                raise RuntimeError('Missing full catalog in tagged build')
-            else:
-                subprocess.check_call(['pandoc', tmp_changelog, '-o',
-                                       os.path.join(auxiliar_tmp_dir, 'changelog.rst')])
-        elif version_tag is None:
-            # a local build
-            subprocess.check_call(['bash', 'repository', 'changelog', '-o', tmp_changelog,
-                                   '--include-tags-regex', '^v[0-9]*\.[0-9]*\.[0-9]$', '--since-tag', 'v0.0.0'], cwd=root)
-            subprocess.check_call(['pandoc', tmp_changelog, '-o',
-                                   os.path.join(auxiliar_tmp_dir, 'changelog.rst')])
+        if sc != 0:
+            raise RuntimeError('Missing full catalog in tagged build')
+        else:
+            convert_changelog()
+    elif version_tag is None:
+        # a local build
+        subprocess.check_call(['bash', 'repository', 'changelog', '-o', tmp_changelog,
+                               '--include-tags-regex', r'^v[0-9]*\.[0-9]*\.[0-9]$', '--since-tag', 'v0.0.0'], cwd=root)
+        convert_changelog()
+
+else:
+    warnings.warn(
+        'Doing a lazy build since the REACTIONS_SPHINX_LAZY_BUILD environment variable has been set; tables and changelog will not be generated', UserWarning)
+
+for p in processes:
+    if p.wait() != 0:
+        raise subprocess.CalledProcessError(p.returncode, p.args)
+
+if doxygen_process is not None:
 
-        subprocess.check_call(['python', os.path.join(
-            root, 'scripts', 'display-table.py'), 'pdg', '--output', os.path.join(static_doc_dir, 'pdg_table.pdf')])
+    if doxygen_process.wait() != 0:
+        raise subprocess.CalledProcessError(
+            doxygen_process.returncode, doxygen_process.args)
 
-        subprocess.check_call(['python', os.path.join(
-            root, 'scripts', 'display-table.py'), 'nubase', '--output', os.path.join(static_doc_dir, 'nubase_table.pdf')])
+    for fp, h in file_hashes(cpp_doc_dir).items():
+        if previous_hashes.get(fp, None) == h:
+            st = previous_stats[fp]
+            os.utime(fp, ns=(st.st_atime_ns, st.st_mtime_ns))
 
-    else:
-        warnings.warn(
-            'Doing a lazy build since the REACTIONS_SPHINX_LAZY_BUILD environment variable has been set; tables and changelog will not be generated', UserWarning)
+    with open(cache_mtimes, 'wt') as f:
+        json.dump(mtimes, f)
 
 # -- General configuration ------------------------------------------------
 
@@ -162,9 +270,9 @@ author = u'Miguel Ramos Pernas'
 # built documents.
 #
 # The short X.Y version.
-version = reactions.__version__
+version = reactions_version
 # The full version, including alpha/beta/rc tags.
-release = reactions.__version__
+release = reactions_version
 
 # The language for content autogenerated by Sphinx. Refer to documentation
 # for a list of supported languages.
@@ -176,7 +284,7 @@ language = None
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This patterns also effect to html_static_path and html_extra_path
-exclude_patterns = ['notebooks/.ipynb_checkpoints/*']
+exclude_patterns = ['notebooks/.ipynb_checkpoints/*', '_doxygen_cache']
 
 # The name of the Pygments (syntax highlighting) style to use.
 pygments_style = 'sphinx'
@@ -6,6 +6,8 @@
 #include <ios>
 #include <limits>
 #include <tuple>
+#include <type_traits>
+#include <unordered_map>
 #include <vector>
 
 #include "reactions/exceptions.hpp"
@@ -35,6 +37,8 @@ namespace reactions::database {
      */
     std::vector<element_type> all_elements() const {
 
+      load_pending_cache();
+
       std::vector<element_type> out;
 
       switch (m_cache.status()) {
@@ -52,7 +56,8 @@ namespace reactions::database {
         auto start = skip_commented_lines(file);
 
         std::size_t count = 0;
-        while (file.ignore(element_type::line_size + 1)) // include end-of-line
+        // include end-of-line; the last call reads nothing but only sets eofbit
+        while (file.ignore(element_type::line_size + 1) && file.gcount())
           ++count;
 
         file.clear(); // we reached the end of the file
@@ -77,45 +82,58 @@ namespace reactions::database {
       return out;
     }
 
-    /// Clear the cache, removing also user-registered elements
-    void clear_cache() { m_cache.clear(); }
-
-    /// Disable the cache
-    void disable_cache() { m_cache.clear_database_elements(); }
-
-    /* \brief Enable the internal cache.
+    /*! \brief Call a function on each element of the database
      *
-     * All the values in the database will be read an stored in a internal
-     * cache. This will speed-up the code, with the caveat of consuming some
-     * memory.
+     * The elements are visited in the same order as in \ref all_elements,
+     * but no container is built. If the cache is enabled the cached
+     * elements are passed by reference, otherwise the database file is read
+     * line by line.
      */
-    void enable_cache() {
+    template <class Function> void for_each_element(Function &&func) const {
 
-      if (m_cache.status() == cache::full)
+      load_pending_cache();
+
+      if (m_cache.status() == cache::full) {
+        for (auto const &el : m_cache)
+          func(el);
         return;
+      }
 
-      // open the database to count the number of lines
       auto file = open_database();
 
-      auto start = skip_commented_lines(file);
+      skip_commented_lines(file);
 
-      std::size_t count = 0;
-      while (file.ignore(element_type::line_size + 1)) // include end-of-line
-        ++count;
+      std::string line;
+      while (std::getline(file, line))
+        func(read_element(line));
 
-      file.clear(); // we reached the end of the file
+      file.close();
 
-      // go back to the start of the table and read the elements
-      file.seekg(start);
+      for (auto const &el : m_cache)
+        func(el);
+    }
 
-      std::string line;
-      m_cache.add_database_elements(count,
-                                    [this, &file, &line]() -> element_type {
-                                      std::getline(file, line);
-                                      return read_element(line);
-                                    });
+    /// Clear the cache, removing also user-registered elements
+    void clear_cache() {
+      m_cache.clear();
+      m_pending_cache = false;
+    }
 
-      file.close();
+    /// Disable the cache
+    void disable_cache() {
+      m_cache.clear_database_elements();
+      m_pending_cache = false;
+    }
+
+    /* \brief Enable the internal cache.
+     *
+     * All the values in the database will be read an stored in a internal
+     * cache. This will speed-up the code, with the caveat of consuming some
+     * memory.
+     */
+    void enable_cache() {
+      m_pending_cache = false;
+      load_cache();
     }
 
     /// Get the path to the database file
@@ -129,6 +147,8 @@ namespace reactions::database {
      */
     template <class... Args> void register_element(Args &&... args) {
 
+      load_pending_cache();
+
       element_type new_element{std::forward<Args>(args)...};
 
       // If the cache is enabled, the checks are done within the cache object,
@@ -174,13 +194,14 @@ namespace reactions::database {
 
     /* \brief Set the path to the database file.
      *
-     * If the cache is enabled, reloads the content using the new path.
+     * The file is not read here. If the cache is enabled, the content is
+     * reloaded from the new path the next time the database is accessed.
      */
     void set_database_path(std::string const &s) {
       m_db = s;
       if (m_cache.status() == cache::full) {
         disable_cache();
-        enable_cache();
+        m_pending_cache = true;
       }
     }
 
@@ -204,6 +225,10 @@ namespace reactions::database {
       using cache_type = std::vector<element_type>;
       using const_iterator_type = typename cache_type::const_iterator;
       using size_type = typename cache_type::size_type;
+      using name_index_type =
+          std::unordered_map<typename NameField::value_type, size_type>;
+      using id_index_type =
+          std::unordered_map<typename IdField::value_type, size_type>;
 
       cache() = default;
 
@@ -212,6 +237,8 @@ namespace reactions::database {
         m_vector.clear();
         m_vector.shrink_to_fit();
         m_separator = 0;
+        m_name_index.clear();
+        m_id_index.clear();
       }
 
       /// Clear the cache
@@ -219,6 +246,7 @@ namespace reactions::database {
         m_vector.erase(database_cbegin(), database_cend());
         m_vector.shrink_to_fit();
         m_separator = 0;
+        rebuild_index();
       }
 
       /// Status of the cache
@@ -273,6 +301,20 @@ namespace reactions::database {
       /// Number of cached elements
       size_type size() const { return m_vector.size(); }
 
+      /// Find an element using the field accessor (the end of the cache is
+      /// returned if it is not found)
+      template <class Field, class T>
+      const_iterator_type find(T const &v) const {
+        if constexpr (std::is_same_v<Field, NameField>)
+          return find_in_index(m_name_index, v);
+        else if constexpr (std::is_same_v<Field, IdField>)
+          return find_in_index(m_id_index, v);
+        else
+          return std::find_if(begin(), end(), [&v](element_type const &el) {
+            return el.template get<Field>() == v;
+          });
+      }
+
       /// Add elements from a database by calling the given function several
       /// times
       template <class ElementReader>
@@ -285,23 +327,14 @@ namespace reactions::database {
 
           auto new_element = func();
 
-          // check that we do not repeat any entry
-          if (user_registered_size() != 0) {
-            auto cend = user_registered_cend();
-            if (std::find_if(user_registered_cbegin(), cend,
-                             [&new_element](element_type const &el) {
-                               return (
-                                   el.template get<NameField>() ==
-                                       new_element.template get<NameField>() ||
-                                   el.template get<IdField>() ==
-                                       new_element.template get<IdField>());
-                             }) != cend)
-              throw reactions::database_error(
-                  (std::string{"User-defined element clashes with database "
-                               "element: \""} +
-                   new_cache.back().name() + "\"")
-                      .c_str());
-          }
+          // check that we do not repeat any entry (only user-registered
+          // elements are indexed at this point)
+          if (user_registered_size() != 0 && clashes(new_element))
+            throw reactions::database_error(
+                (std::string{"User-defined element clashes with database "
+                             "element: \""} +
+                 new_element.name() + "\"")
+                    .c_str());
 
           new_cache.emplace_back(std::move(new_element));
         }
@@ -313,26 +346,21 @@ namespace reactions::database {
                          std::make_move_iterator(user_registered_cend()));
         m_separator = n;
         m_vector = std::move(new_cache);
+        rebuild_index();
       }
 
       /// Add a new element (by the user)
       template <class... Args>
       element_type const &add_user_element(Args &&... args) {
         element_type new_element{std::forward<Args>(args)...};
-        auto e = end();
-        if (std::find_if(begin(), e,
-                         [this, &new_element](element_type const &el) {
-                           return (el.template get<NameField>() ==
-                                       new_element.template get<NameField>() ||
-                                   el.template get<IdField>() ==
-                                       new_element.template get<IdField>());
-                         }) != e) {
+        if (clashes(new_element)) {
           throw reactions::database_error(
               (std::string{"User-registered element clashes: \""} +
                new_element.name() + "\"")
                   .c_str());
         }
         m_vector.emplace_back(std::move(new_element));
+        index_element(m_vector.size() - 1);
         return m_vector.back();
       }
 
@@ -344,8 +372,88 @@ namespace reactions::database {
       /// the database
       size_type m_separator = 0;
 
-    } m_cache; /// Cache for elements loaded from the database or registered by
-               /// the user
+      /// Position of the elements in the cache by name
+      name_index_type m_name_index;
+
+      /// Position of the elements in the cache by ID
+      id_index_type m_id_index;
+
+      /// Find an element using one of the indices
+      template <class Index, class T>
+      const_iterator_type find_in_index(Index const &index, T const &v) const {
+        auto it = index.find(v);
+        return it == index.cend() ? end() : begin() + it->second;
+      }
+
+      /// Whether the name or ID of an element are already in the cache
+      bool clashes(element_type const &el) const {
+        return m_name_index.count(el.template get<NameField>()) ||
+               m_id_index.count(el.template get<IdField>());
+      }
+
+      /// Add the element at the given position to the indices (the first
+      /// element with a given name or ID takes precedence)
+      void index_element(size_type i) {
+        m_name_index.emplace(m_vector[i].template get<NameField>(), i);
+        m_id_index.emplace(m_vector[i].template get<IdField>(), i);
+      }
+
+      /// Build the indices from the elements in the cache
+      void rebuild_index() {
+        m_name_index.clear();
+        m_id_index.clear();
+        m_name_index.reserve(m_vector.size());
+        m_id_index.reserve(m_vector.size());
+        for (size_type i = 0; i < m_vector.size(); ++i)
+          index_element(i);
+      }
+
+    };
+
+    /// Cache for elements loaded from the database or registered by the user
+    mutable cache m_cache;
+
+    /// Whether the database elements must be loaded in the cache on access
+    mutable bool m_pending_cache = false;
+
+    /// Read all the elements in the database and store them in the cache
+    void load_cache() const {
+
+      if (m_cache.status() == cache::full)
+        return;
+
+      // open the database to count the number of lines
+      auto file = open_database();
+
+      auto start = skip_commented_lines(file);
+
+      std::size_t count = 0;
+      // include end-of-line; the last call reads nothing but only sets eofbit
+      while (file.ignore(element_type::line_size + 1) && file.gcount())
+        ++count;
+
+      file.clear(); // we reached the end of the file
+
+      // go back to the start of the table and read the elements
+      file.seekg(start);
+
+      std::string line;
+      m_cache.add_database_elements(count,
+                                    [this, &file, &line]() -> element_type {
+                                      std::getline(file, line);
+                                      return read_element(line);
+                                    });
+
+      file.close();
+    }
+
+    /// Load the cache if it was enabled before changing the database path
+    void load_pending_cache() const {
+      if (m_pending_cache) {
+        load_cache();
+        m_pending_cache = false;
+      }
+    }
 
     /// Open the database
     std::ifstream open_database() const {
@@ -437,22 +545,25 @@ namespace reactions::database {
     /// Access an element using the field accessor
     template <class Field, class T> element_type access(T const &v) const {
 
+      load_pending_cache();
+
       switch (m_cache.status()) {
-      case (cache::full): // the full database is loaded
+      case (cache::full): { // the full database is loaded
 
-        for (auto const &el : m_cache)
-          if (el.template get<Field>() == v)
-            return el;
+        auto it = m_cache.template find<Field>(v);
+        if (it != m_cache.end())
+          return *it;
 
         break; // throws an exception
+      }
+      case (cache::user): { // only user-registered entries exist
 
-      case (cache::user): // only user-registered entries exist
-
-        for (auto const &el : m_cache)
-          if (el.template get<Field>() == v)
-            return el;
+        auto it = m_cache.template find<Field>(v);
+        if (it != m_cache.end())
+          return *it;
 
         [[fallthrough]]; // continue as if we had no cache
+      }
 
       case (cache::empty): // the cache is empty
 
@@ -4,6 +4,8 @@
  */
 #pragma once
 
+#include <algorithm>
+#include <map>
 #include <optional>
 #include <string>
 #include <utility>
@@ -57,7 +59,13 @@ namespace reactions {
       auto start = sit; // keep track of the beginning of an expression
       while (sit != end) {
 
-        if (tokens::match_token<tokens::space>(sit)) {
+        if (!tokens::match_leading_character<tokens::space, tokens::left_bra,
+                                             tokens::right_bra, tokens::arrow>(
+                *sit)) {
+          // part of the name of an element
+          ++sit;
+          continue;
+        } else if (tokens::match_token<tokens::space>(sit)) {
 
           if (sit == start) {
             // remove consecutive spaces
@@ -226,64 +234,86 @@ namespace reactions {
 
   /// Internal utilities for the \ref reactions::processes namespace
   namespace processes::detail {
-    /*! \brief Compare two nodes
+    /*! \brief Assign canonical labels to the nodes of reactions and decays
      *
-     * \param first node to compare
-     * \param second node to compare
-     * \return whether the two nodes are equal or not (processing
-     * whether they are reactions, decays or elements).
+     * Labels follow the Aho-Hopcroft-Ullman algorithm: elements that compare
+     * equal share a label, and chains are labelled from their type and the
+     * sorted labels of their nodes. Two processes labelled by the same object
+     * are equal if and only if their labels are equal, independently of the
+     * order of their nodes.
      */
-    template <class Element, template <class> class Chain>
-    inline bool check_nodes(std::vector<node<Element, Chain>> const &first,
-                            std::vector<node<Element, Chain>> const &second) {
+    template <class Element> class canonical_labeler final {
 
-      auto size = first.size();
+    public:
+      /// Label of an element
+      std::size_t operator()(Element const &element) {
 
-      if (size != second.size())
-        return false;
+        auto it = std::find_if(
+            m_elements.cbegin(), m_elements.cend(),
+            [&element](auto const &e) { return *e == element; });
 
-      // two masks to count the elements that are gone
-      std::vector<bool> mask(size, false);
+        std::size_t index = it - m_elements.cbegin();
 
-      for (auto i = 0u; i < size; ++i) {
+        if (it == m_elements.cend())
+          m_elements.push_back(&element);
 
-        for (auto j = 0u; j < size; ++j) {
+        return intern({processes::node_type::element, index});
+      }
 
-          if (mask[j])
-            // already used
-            continue;
+      /// Label of a reaction
+      std::size_t operator()(reactions::reaction<Element> const &r) {
 
-          if (second[j].type() != first[i].type())
-            // different types
-            continue;
+        std::vector<std::size_t> key = {processes::node_type::reaction,
+                                        r.reactants().size()};
+        key.reserve(2 + r.reactants().size() + r.products().size());
 
-          switch (first[i].type()) {
-          case (processes::node_type::element):
-            if (first[i].as_element() == second[i].as_element())
-              mask[j] = true;
-            break;
-          case (processes::node_type::reaction):
-            if (first[i].as_chain() == second[i].as_chain())
-              mask[j] = true;
-            break;
-          case (processes::node_type::decay):
-            if (first[i].as_chain() == second[i].as_chain())
-              mask[j] = true;
-            break;
-          case (processes::node_type::unknown_node_type):
-            throw reactions::internal_error(
-                "A node can not be of unknown type (internal error); please "
-                "report the bug");
-            break;
-          }
+        append_sorted_labels(key, r.reactants());
+        append_sorted_labels(key, r.products());
+
+        return intern(std::move(key));
+      }
+
+      /// Label of a decay
+      std::size_t operator()(reactions::decay<Element> const &d) {
+
+        std::vector<std::size_t> key = {processes::node_type::decay,
+                                        (*this)(d.head())};
+        key.reserve(2 + d.products().size());
+
+        append_sorted_labels(key, d.products());
+
+        return intern(std::move(key));
+      }
+
+    protected:
+      /// Append the sorted labels of a set of nodes to a key
+      template <template <class> class Chain>
+      void
+      append_sorted_labels(std::vector<std::size_t> &key,
+                           std::vector<node<Element, Chain>> const &nodes) {
+
+        auto const first = key.size();
+
+        for (auto const &n : nodes) {
+          if (n.is_element())
+            key.push_back((*this)(n.as_element()));
+          else
+            key.push_back((*this)(n.as_chain()));
         }
-        // if we reach this point, no match has been found for "first[i]"
-        return false;
+
+        std::sort(key.begin() + first, key.end());
       }
 
-      // all of them have been matched
-      return true;
-    }
+      /// Get the label associated to a key, creating a new one if needed
+      std::size_t intern(std::vector<std::size_t> &&key) {
+        return m_labels.emplace(std::move(key), m_labels.size()).first->second;
+      }
+
+      /// Elements with different labels
+      std::vector<Element const *> m_elements;
+      /// Labels of the elements and chains
+      std::map<std::vector<std::size_t>, std::size_t> m_labels;
+    };
   } // namespace processes::detail
 } // namespace reactions
 
@@ -359,12 +389,15 @@ namespace reactions {
      */
     bool operator==(reaction<Element> const &other) const {
 
+      if (this == &other)
+        return true;
+
       if (m_reactants.size() != other.m_reactants.size() ||
           m_products.size() != other.m_products.size())
         return false;
 
-      return processes::detail::check_nodes(m_reactants, other.m_reactants) &&
-             processes::detail::check_nodes(m_products, other.m_products);
+      processes::detail::canonical_labeler<Element> labeler;
+      return labeler(*this) == labeler(other);
     }
 
     /// \copydoc reaction<Element>::operator==
@@ -474,11 +507,15 @@ namespace reactions {
     /// Comparison operator
     bool operator==(decay<Element> const &other) const {
 
-      if (m_products.size() != other.m_products.size())
+      if (this == &other)
+        return true;
+
+      if (m_products.size() != other.m_products.size() ||
+          head() != other.head())
         return false;
 
-      return (*m_head == *other.m_head) &&
-             processes::detail::check_nodes(m_products, other.m_products);
+      processes::detail::canonical_labeler<Element> labeler;
+      return labeler(*this) == labeler(other);
     }
 
     /// Comparison operator
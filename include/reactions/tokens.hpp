@@ -3,6 +3,7 @@
  */
 #pragma once
 
+#include <array>
 #include <cstdlib>
 #include <string>
 #include <utility>
@@ -14,6 +15,8 @@ namespace reactions::tokens {
   /// Template to define new tokens
   template <char... C> struct token {
     static const size_t size = sizeof...(C);
+    /// Characters of the token
+    static constexpr char characters[] = {C...};
   };
 
   /// Defines the separation of two elements
@@ -39,6 +42,20 @@ namespace reactions::tokens {
                             it);
   }
 
+  /// Table telling whether each character starts any of the given tokens
+  template <class... Tokens> struct leading_characters {
+    static constexpr std::array<bool, 256> table = [] {
+      std::array<bool, 256> t{};
+      ((t[static_cast<unsigned char>(Tokens::characters[0])] = true), ...);
+      return t;
+    }();
+  };
+
+  /// Check if the given character starts any of the tokens
+  template <class... Tokens> constexpr bool match_leading_character(char c) {
+    return leading_characters<Tokens...>::table[static_cast<unsigned char>(c)];
+  }
+
   /// Check if the given character matches any of the template arguments
   template <char... C> constexpr bool match_any(char c) {
     return ((C == c) || ...);
@@ -4,6 +4,7 @@
 #pragma once
 #include "reactions/exceptions.hpp"
 #include "reactions/pow_enum.hpp"
+#include <array>
 #include <string>
 #include <type_traits>
 
@@ -125,6 +126,21 @@ namespace reactions {
               .c_str());
     }
 
+    /*! \brief Scale factors of all the units with respect to a reference
+     *
+     * The factors are indexed by the value of the enumeration, where the first
+     * entry corresponds to the unknown units and is never used.
+     */
+    template <class Properties, class Units>
+    auto scale_factors_from(Units reference) {
+      std::array<double, Properties::size + 1> factors = {};
+      for (auto u : Properties::list)
+        factors[u] = (u == reference ? 1.
+                                     : scale_factor_for(reference) /
+                                           scale_factor_for(u));
+      return factors;
+    }
+
     /// Use the template argument as a reference to determine scale factors
     template <class Units, Units U> struct reference;
 
@@ -132,11 +148,12 @@ namespace reactions {
     template <energy_units U> struct reference<energy_units, U> {
       using units_type = energy_units;
       /// Determine the scale factor from a reference
-      static constexpr auto scale_factor(energy_units u) {
-        if (u == U)
-          return 1.;
-        else
-          return scale_factor_for(U) / scale_factor_for(u);
+      static auto scale_factor(energy_units u) {
+        static auto const factors =
+            scale_factors_from<energy_units_properties>(U);
+        if (u == energy_units::unknown_energy_units)
+          return scale_factor_for(u); // throws an exception
+        return factors[u];
       }
     };
 
@@ -144,11 +161,12 @@ namespace reactions {
     template <time_units U> struct reference<time_units, U> {
       using units_type = time_units;
       /// Determine the scale factor from a reference
-      static constexpr auto scale_factor(time_units u) {
-        if (u == U)
-          return 1.;
-        else
-          return scale_factor_for(U) / scale_factor_for(u);
+      static auto scale_factor(time_units u) {
+        static auto const factors =
+            scale_factors_from<time_units_properties>(U);
+        if (u == time_units::unknown_time_units)
+          return scale_factor_for(u); // throws an exception
+        return factors[u];
       }
     };
 
@@ -1,6 +1,11 @@
+import os as _os
+
 # Place where the project version is specified
 __version__ = '0.1.1'
 
+# Directory containing the database files
+_data_dir = _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), 'data')
+
 try:
 
     from .capi import (
@@ -10,7 +15,8 @@ try:
         nubase_database_sgl, nubase_system_of_units_sgl,
         pdg_database_sgl, pdg_system_of_units_sgl,
         # functions
-        is_element, node_type,
+        check_decays, check_reactions, is_element, node_type,
+        parse_decays, parse_reactions,
         # errors
         DatabaseError, LookupError, SyntaxError, InternalError, ValueError
     )
@@ -22,19 +28,18 @@ try:
     nubase_system_of_units = nubase_system_of_units_sgl()  # overwrite it
 
     # Set the path to the database(s)
-    import os
-    nubase_database.set_database_path(os.path.abspath(os.path.join(
-        os.path.dirname(__file__), 'data', 'nubase_2020.txt')))
-    pdg_database.set_database_path(os.path.abspath(os.path.join(
-        os.path.dirname(__file__), 'data', 'pdg_mass_width_2020.txt')))
-    del os
+    nubase_database.set_database_path(
+        _os.path.join(_data_dir, 'nubase_2020.txt'))
+    pdg_database.set_database_path(
+        _os.path.join(_data_dir, 'pdg_mass_width_2020.txt'))
 
     # Variables exported
     __all__ = ['node', 'reaction', 'decay',
                'string_element', 'nubase_element', 'pdg_element',
                'nubase_database', 'nubase_database_sgl', 'nubase_system_of_units', 'nubase_system_of_units_sgl',
                'pdg_database', 'pdg_database_sgl', 'pdg_system_of_units', 'pdg_system_of_units_sgl',
-               'is_element', 'node_type',
+               'check_decays', 'check_reactions', 'is_element', 'node_type',
+               'parse_decays', 'parse_reactions',
                'DatabaseError', 'LookupError', 'SyntaxError', 'InternalError', 'ValueError']
 
 except ModuleNotFoundError:
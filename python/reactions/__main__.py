@@ -1,33 +1,57 @@
 """
 Process a sets of reactions and/or decays, checking its syntax
 """
-from . import nubase_database, pdg_database, reaction, decay
+from . import nubase_database, pdg_database, check_decays, check_reactions
 
 import argparse
+import os
+import shutil
+import sys
 
 
 def check_syntax(reactions, decays, kind):
     """ Check the syntax of the given decays and reactions """
     if reactions:
-        for r in reactions:
-            reaction(r, kind=kind)
+        check_reactions(reactions, kind=kind)
 
     if decays:
-        for d in decays:
-            decay(d, kind=kind)
+        check_decays(decays, kind=kind)
 
 
 def print_table(kind):
     """ Print the table of particles """
     if kind == 'nubase':
-        with open(nubase_database.get_database_path()) as db:
-            print(db.read())
+        path = nubase_database.get_database_path()
     elif kind == 'pdg':
-        with open(pdg_database.get_database_path()) as db:
-            print(db.read())
+        path = pdg_database.get_database_path()
     else:
         raise ValueError(f'Unknown kind "{kind}"')
 
+    sys.stdout.flush()
+
+    # text streams (e.g. io.StringIO) do not have an underlying binary buffer
+    output = getattr(sys.stdout, 'buffer', None)
+
+    if output is None:
+        output = sys.stdout
+        with open(path) as db:
+            shutil.copyfileobj(db, output, length=1 << 20)
+    else:
+        with open(path, 'rb') as db:
+            try:
+                # copy within the kernel if possible (regular file outputs)
+                remaining = os.fstat(db.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        db.fileno(), sys.stdout.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            except (AttributeError, OSError):
+                shutil.copyfileobj(db, output, length=1 << 20)
+
+    output.flush()
+
 
 parser = argparse.ArgumentParser(description=__doc__)
 subparsers = parser.add_subparsers(help='Command to run')
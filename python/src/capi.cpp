@@ -26,6 +26,16 @@ PyObject *is_element(PyObject *module, PyObject *args) {
     Py_RETURN_FALSE;
 }
 
+/// Get the name of a node type as an interned string, created only once
+template <reactions::processes::node_type Type> PyObject *node_type_name() {
+  static PyObject *name = nullptr;
+  if (!name)
+    name = PyUnicode_InternFromString(
+        reactions::processes::node_type_properties::to_c_string(Type));
+  Py_XINCREF(name);
+  return name;
+}
+
 // Get the type of the node as a string
 PyObject *node_type(PyObject *module, PyObject *args) {
 
@@ -40,13 +50,270 @@ PyObject *node_type(PyObject *module, PyObject *args) {
 
   REACTIONS_PYTHON_NODE_CHECK_UNKNOWN(((Node *)obj));
 
-  return PyUnicode_FromString(
-      reactions::processes::node_type_properties::to_c_string(
-          ((Node *)obj)->c_type));
+  switch (((Node *)obj)->c_type) {
+  case (reactions::processes::node_type::element):
+    return node_type_name<reactions::processes::node_type::element>();
+  case (reactions::processes::node_type::reaction):
+    return node_type_name<reactions::processes::node_type::reaction>();
+  case (reactions::processes::node_type::decay):
+    return node_type_name<reactions::processes::node_type::decay>();
+  default:
+    return PyUnicode_FromString(
+        reactions::processes::node_type_properties::to_c_string(
+            ((Node *)obj)->c_type));
+  }
+}
+
+/// Parse a reaction or a decay, discarding the result
+template <bool IsDecay, class Element>
+void parse_process(std::string const &str) {
+  if constexpr (IsDecay)
+    reactions::make_decay<Element>(str);
+  else
+    reactions::make_reaction<Element>(str);
+}
+
+/// Parse a reaction or a decay into a new Python object
+template <bool IsDecay, class Element>
+PyObject *new_process(std::string const &str,
+                      reactions::python::element_kind ek) {
+  if constexpr (IsDecay) {
+    PyObject *obj = Decay_New(reactions::make_decay<Element>(str));
+    if (obj)
+      ((Decay *)obj)->ek = ek;
+    return obj;
+  } else {
+    PyObject *obj = Reaction_New(reactions::make_reaction<Element>(str));
+    if (obj)
+      ((Reaction *)obj)->ek = ek;
+    return obj;
+  }
+}
+
+// Build the reactions or decays from a sequence of strings
+template <bool IsDecay>
+PyObject *parse_processes(PyObject *module, PyObject *args, PyObject *kwargs) {
+
+  PyObject *strings = nullptr;
+  const char *kind = REACTIONS_PYTHON_DEFAULT_ELEMENT_TYPE;
+
+  static const char *kwds[] = {"strings", "kind", NULL};
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|s",
+                                   const_cast<char **>(kwds), &strings, &kind))
+    return NULL;
+
+  auto const ek = reactions::python::element_kind_properties::from_string(kind);
+
+  if (ek == reactions::python::element_kind::unknown_element_kind) {
+    PyErr_SetString(
+        PyExc_ValueError,
+        (std::string{"Unknown element type \""} + kind + "\"").c_str());
+    return NULL;
+  }
+
+  PyObject *seq =
+      PySequence_Fast(strings, "Argument must be a sequence of strings");
+  if (!seq)
+    return NULL;
+
+  auto const size = PySequence_Fast_GET_SIZE(seq);
+
+  PyObject *out = PyList_New(size);
+  if (!out) {
+    Py_DECREF(seq);
+    return NULL;
+  }
+
+  try {
+    for (Py_ssize_t i = 0; i < size; ++i) {
+
+      const char *str = PyUnicode_AsUTF8(PySequence_Fast_GET_ITEM(seq, i));
+      if (!str) {
+        Py_DECREF(out);
+        Py_DECREF(seq);
+        return NULL;
+      }
+
+      PyObject *obj;
+      switch (ek) {
+      case (reactions::python::element_kind::pdg):
+        obj = new_process<IsDecay, reactions::pdg_element>(str, ek);
+        break;
+      case (reactions::python::element_kind::nubase):
+        obj = new_process<IsDecay, reactions::nubase_element>(str, ek);
+        break;
+      default:
+        obj = new_process<IsDecay, reactions::string_element>(str, ek);
+      }
+
+      if (!obj) {
+        Py_DECREF(out);
+        Py_DECREF(seq);
+        return NULL;
+      }
+
+      PyList_SET_ITEM(out, i, obj); // steals the reference
+    }
+  }
+  REACTIONS_PYTHON_CATCH_ERRORS(NULL, Py_DECREF(out), Py_DECREF(seq))
+
+  Py_DECREF(seq);
+
+  return out;
+}
+
+// Check the syntax of a sequence of reactions or decays
+template <bool IsDecay>
+PyObject *check_processes(PyObject *module, PyObject *args, PyObject *kwargs) {
+
+  PyObject *strings = nullptr;
+  const char *kind = REACTIONS_PYTHON_DEFAULT_ELEMENT_TYPE;
+
+  static const char *kwds[] = {"strings", "kind", NULL};
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|s",
+                                   const_cast<char **>(kwds), &strings, &kind))
+    return NULL;
+
+  auto const ek = reactions::python::element_kind_properties::from_string(kind);
+
+  if (ek == reactions::python::element_kind::unknown_element_kind) {
+    PyErr_SetString(
+        PyExc_ValueError,
+        (std::string{"Unknown element type \""} + kind + "\"").c_str());
+    return NULL;
+  }
+
+  PyObject *seq =
+      PySequence_Fast(strings, "Argument must be a sequence of strings");
+  if (!seq)
+    return NULL;
+
+  auto const size = PySequence_Fast_GET_SIZE(seq);
+
+  try {
+    for (Py_ssize_t i = 0; i < size; ++i) {
+
+      const char *str = PyUnicode_AsUTF8(PySequence_Fast_GET_ITEM(seq, i));
+      if (!str) {
+        Py_DECREF(seq);
+        return NULL;
+      }
+
+      switch (ek) {
+      case (reactions::python::element_kind::pdg):
+        parse_process<IsDecay, reactions::pdg_element>(str);
+        break;
+      case (reactions::python::element_kind::nubase):
+        parse_process<IsDecay, reactions::nubase_element>(str);
+        break;
+      default:
+        parse_process<IsDecay, reactions::string_element>(str);
+      }
+    }
+  }
+  REACTIONS_PYTHON_CATCH_ERRORS(NULL, Py_DECREF(seq))
+
+  Py_DECREF(seq);
+
+  Py_RETURN_NONE;
 }
 
 // Module global functions
 static PyMethodDef capi_methods[] = {
+    {"check_decays", (PyCFunction)check_processes<true>,
+     METH_VARARGS | METH_KEYWORDS,
+     R"(check_decays(strings, kind='string')
+
+Check the syntax of several decays at once, without building the
+corresponding :class:`reactions.decay` objects
+
+Parameters
+----------
+strings : list(str)
+    Decays to check
+kind : str
+    Type of the elements (`string`, `nubase` or `pdg`)
+
+Raises
+------
+reactions.SyntaxError
+    If the syntax of any of the decays is incorrect
+reactions.LookupError
+    If any of the elements is not found in the database
+)"},
+    {"check_reactions", (PyCFunction)check_processes<false>,
+     METH_VARARGS | METH_KEYWORDS,
+     R"(check_reactions(strings, kind='string')
+
+Check the syntax of several reactions at once, without building the
+corresponding :class:`reactions.reaction` objects
+
+Parameters
+----------
+strings : list(str)
+    Reactions to check
+kind : str
+    Type of the elements (`string`, `nubase` or `pdg`)
+
+Raises
+------
+reactions.SyntaxError
+    If the syntax of any of the reactions is incorrect
+reactions.LookupError
+    If any of the elements is not found in the database
+)"},
+    {"parse_decays", (PyCFunction)parse_processes<true>,
+     METH_VARARGS | METH_KEYWORDS,
+     R"(parse_decays(strings, kind='string')
+
+Build several decays at once
+
+Parameters
+----------
+strings : list(str)
+    Decays to parse
+kind : str
+    Type of the elements (`string`, `nubase` or `pdg`)
+
+Returns
+-------
+list(reactions.decay)
+    Decays, in the same order as the input strings
+
+Raises
+------
+reactions.SyntaxError
+    If the syntax of any of the decays is incorrect
+reactions.LookupError
+    If any of the elements is not found in the database
+)"},
+    {"parse_reactions", (PyCFunction)parse_processes<false>,
+     METH_VARARGS | METH_KEYWORDS,
+     R"(parse_reactions(strings, kind='string')
+
+Build several reactions at once
+
+Parameters
+----------
+strings : list(str)
+    Reactions to parse
+kind : str
+    Type of the elements (`string`, `nubase` or `pdg`)
+
+Returns
+-------
+list(reactions.reaction)
+    Reactions, in the same order as the input strings
+
+Raises
+------
+reactions.SyntaxError
+    If the syntax of any of the reactions is incorrect
+reactions.LookupError
+    If any of the elements is not found in the database
+)"},
     {"is_element", (PyCFunction)is_element, METH_VARARGS,
      R"(is_element(obj)
 
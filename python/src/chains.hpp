@@ -264,6 +264,14 @@ static PyObject *Reaction_richcompare(PyObject *obj1, PyObject *obj2, int op) {
       !PyObject_IsInstance(obj2, (PyObject *)&ReactionType))
     Py_RETURN_FALSE;
 
+  if (obj1 == obj2) {
+    // an object is always equal to itself
+    if (op == Py_EQ)
+      Py_RETURN_TRUE;
+    else if (op == Py_NE)
+      Py_RETURN_FALSE;
+  }
+
   if (((Reaction *)obj1)->ek != ((Reaction *)obj2)->ek) {
     PyErr_SetString(PyExc_TypeError,
                     "Reactions contain objects of different types");
@@ -313,7 +321,7 @@ python_node_fill_reaction(Reaction *self,
   // fill reactants
   for (auto i = 0u; i < reac.reactants().size(); ++i) {
 
-    auto &obj = reac.reactants().at(i);
+    auto &obj = reac.reactants()[i];
 
     PyObject *o = obj.is_element()
                       ? python_element<Element>::new_instance(obj.as_element())
@@ -324,13 +332,13 @@ python_node_fill_reaction(Reaction *self,
       return false;
     }
 
-    PyList_SetItem(self->reactants, i, o); // steals the reference
+    PyList_SET_ITEM(self->reactants, i, o); // steals the reference
   }
 
   // fill products
   for (auto i = 0u; i < reac.products().size(); ++i) {
 
-    auto &obj = reac.products().at(i);
+    auto &obj = reac.products()[i];
 
     PyObject *o = obj.is_element()
                       ? python_element<Element>::new_instance(obj.as_element())
@@ -341,7 +349,7 @@ python_node_fill_reaction(Reaction *self,
       return false;
     }
 
-    PyList_SetItem(self->products, i, o); // steals the reference
+    PyList_SET_ITEM(self->products, i, o); // steals the reference
   }
 
   return true;
@@ -559,6 +567,14 @@ static PyObject *Decay_richcompare(PyObject *obj1, PyObject *obj2, int op) {
       !PyObject_IsInstance(obj2, (PyObject *)&DecayType))
     Py_RETURN_FALSE;
 
+  if (obj1 == obj2) {
+    // an object is always equal to itself
+    if (op == Py_EQ)
+      Py_RETURN_TRUE;
+    else if (op == Py_NE)
+      Py_RETURN_FALSE;
+  }
+
   if (((Decay *)obj1)->ek != ((Decay *)obj2)->ek) {
     PyErr_SetString(PyExc_TypeError,
                     "Decays contain objects of different types");
@@ -617,7 +633,7 @@ inline bool python_node_fill_decay(Decay *self,
   // fill products
   for (auto i = 0u; i < reac.products().size(); ++i) {
 
-    auto &obj = reac.products().at(i);
+    auto &obj = reac.products()[i];
 
     PyObject *o = obj.is_element()
                       ? python_element<Element>::new_instance(obj.as_element())
@@ -628,7 +644,7 @@ inline bool python_node_fill_decay(Decay *self,
       return false;
     }
 
-    PyList_SetItem(self->products, i, o); // steals the reference
+    PyList_SET_ITEM(self->products, i, o); // steals the reference
   }
 
   return true;
@@ -1,5 +1,9 @@
 #pragma once
+#include <algorithm>
+#include <cstring>
+#include <stdexcept>
 #include <utility>
+#include <vector>
 
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
@@ -144,19 +148,127 @@ struct database_accessors {
 
   /// Get all the elements
   static PyObject *all_elements(Database *self) {
-    PyObject *list = NULL;
+
+    PyObject *list = PyList_New(0);
+    if (!list)
+      return NULL;
 
     try {
-      auto all_elements = self->instance->all_elements();
+      self->instance->for_each_element([list](auto const &el) {
+        PyObject *obj = element_new(std::decay_t<decltype(el)>{el});
+        if (!obj || PyList_Append(list, obj) < 0) {
+          Py_XDECREF(obj);
+          throw std::runtime_error("Python error already set");
+        }
+        Py_DECREF(obj);
+      });
+    }
+    REACTIONS_PYTHON_CATCH_ERRORS(NULL, Py_DECREF(list));
+
+    return list;
+  }
+
+  /// Get the values of some attributes for all the elements
+  static PyObject *columns(Database *self, PyObject *args) {
+
+    PyObject *names;
+    if (!PyArg_ParseTuple(args, "O", &names))
+      return NULL;
+
+    PyObject *seq = PySequence_Fast(names, "Argument must be a sequence");
+    if (!seq)
+      return NULL;
+
+    auto const nfields = PySequence_Fast_GET_SIZE(seq);
 
-      list = PyList_New(all_elements.size());
+    // resolve the getters only once
+    std::vector<getter> getters(nfields, nullptr);
 
-      for (auto i = 0u; i < all_elements.size(); ++i)
-        PyList_SetItem(list, i, element_new(std::move(all_elements[i])));
+    for (Py_ssize_t i = 0; i < nfields; ++i) {
+
+      PyObject *item = PySequence_Fast_GET_ITEM(seq, i);
+
+      if (!PyUnicode_Check(item)) {
+        Py_DECREF(seq);
+        PyErr_SetString(PyExc_TypeError, "Field names must be strings");
+        return NULL;
+      }
+
+      const char *name = PyUnicode_AsUTF8(item);
+      if (!name) {
+        Py_DECREF(seq);
+        return NULL;
+      }
+
+      for (auto gs = ElementType->tp_getset; gs->name; ++gs)
+        if (std::strcmp(gs->name, name) == 0) {
+          getters[i] = gs->get;
+          break;
+        }
+
+      if (!getters[i]) {
+        Py_DECREF(seq);
+        PyErr_Format(ValueError, "Unknown field \"%s\"", name);
+        return NULL;
+      }
+
+      // the lists are owned by the output dictionary, so keys must be unique
+      if (std::find(getters.cbegin(), getters.cbegin() + i, getters[i]) !=
+          getters.cbegin() + i) {
+        Py_DECREF(seq);
+        PyErr_Format(ValueError, "Duplicated field \"%s\"", name);
+        return NULL;
+      }
     }
-    REACTIONS_PYTHON_CATCH_ERRORS(NULL);
 
-    return list;
+    PyObject *dict = PyDict_New();
+    if (!dict) {
+      Py_DECREF(seq);
+      return NULL;
+    }
+
+    // a single element is reused to evaluate the getters on all the elements
+    PyObject *proxy =
+        ElementType->tp_new((PyTypeObject *)ElementType, NULL, NULL);
+    if (!proxy) {
+      Py_DECREF(seq);
+      Py_DECREF(dict);
+      return NULL;
+    }
+
+    try {
+      std::vector<PyObject *> lists(nfields, nullptr);
+      for (Py_ssize_t i = 0; i < nfields; ++i) {
+        lists[i] = PyList_New(0);
+        if (!lists[i] ||
+            PyDict_SetItem(dict, PySequence_Fast_GET_ITEM(seq, i), lists[i]) <
+                0) {
+          Py_XDECREF(lists[i]);
+          throw std::runtime_error("Python error already set");
+        }
+        Py_DECREF(lists[i]); // the dictionary holds the reference
+      }
+
+      self->instance->for_each_element([&](auto const &el) {
+        ((Element *)proxy)->element = el;
+
+        for (Py_ssize_t i = 0; i < nfields; ++i) {
+          PyObject *value = getters[i](proxy, NULL);
+          if (!value || PyList_Append(lists[i], value) < 0) {
+            Py_XDECREF(value);
+            throw std::runtime_error("Python error already set");
+          }
+          Py_DECREF(value);
+        }
+      });
+    }
+    REACTIONS_PYTHON_CATCH_ERRORS(NULL, Py_DECREF(seq); Py_DECREF(dict);
+                                  Py_DECREF(proxy));
+
+    Py_DECREF(seq);
+    Py_DECREF(proxy);
+
+    return dict;
   }
 };
 
@@ -217,6 +329,28 @@ Returns
 -------
 list(pdg_element)
     All the elements
+)"},
+    {"columns", (PyCFunction)DatabasePDG_accessors::columns, METH_VARARGS,
+     R"(columns(names)
+
+Extract the values of the given attributes for all the elements in a single
+pass over the database. This includes all those elements registered by the
+user.
+
+Parameters
+----------
+names : list(str)
+    Names of the attributes of :class:`reactions.pdg_element` to extract
+
+Returns
+-------
+dict(str, list)
+    Values of each attribute, in the same order as :func:`all_elements`
+
+Raises
+------
+reactions.ValueError
+    If any of the names does not correspond to an attribute or is repeated
 )"},
     {"clear_cache", (PyCFunction)DatabasePDG_accessors::clear_cache,
      METH_NOARGS,
@@ -256,8 +390,9 @@ of :class:`reactions.pdg_element`.)"},
      METH_VARARGS,
      R"(set_database_path(path)
 
-Set the path to the database file. If the cache is enabled, reloads the
-data. If the cache is enabled, elements are reloaded in memory.
+Set the path to the database file. The file is not read until the database
+is accessed. If the cache is enabled, elements are reloaded in memory at that
+point.
 
 Parameters
 ----------
@@ -351,6 +486,28 @@ Returns
 -------
 list(nubase_element)
     All the elements
+)"},
+    {"columns", (PyCFunction)DatabaseNuBase_accessors::columns, METH_VARARGS,
+     R"(columns(names)
+
+Extract the values of the given attributes for all the elements in a single
+pass over the database. This includes all those elements registered by the
+user.
+
+Parameters
+----------
+names : list(str)
+    Names of the attributes of :class:`reactions.nubase_element` to extract
+
+Returns
+-------
+dict(str, list)
+    Values of each attribute, in the same order as :func:`all_elements`
+
+Raises
+------
+reactions.ValueError
+    If any of the names does not correspond to an attribute or is repeated
 )"},
     {"clear_cache", (PyCFunction)DatabaseNuBase_accessors::clear_cache,
      METH_NOARGS,
@@ -379,8 +536,9 @@ of :class:`reactions.nubase_element`.)"},
      (PyCFunction)DatabaseNuBase_accessors::set_database_path, METH_VARARGS,
      R"(set_database_path(path)
 
-Set the path to the database file. If the cache is enabled, reloads the
-data. If the cache is enabled, elements are reloaded in memory.
+Set the path to the database file. The file is not read until the database
+is accessed. If the cache is enabled, elements are reloaded in memory at that
+point.
 
 Parameters
 ----------
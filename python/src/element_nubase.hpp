@@ -1,5 +1,6 @@
 #pragma once
 
+#include <new>
 #include <string>
 #include <tuple>
 #include <utility>
@@ -30,12 +31,22 @@ static PyObject *ElementNuBase_new(PyTypeObject *type,
   if (!self)
     return NULL;
 
+  // The memory is zero-initialized, so the element must be constructed
+  new (&self->element) reactions::nubase_element{reactions::nubase_element::base_type{}};
+
   // Set the type for the base class
   self->node.c_type = reactions::processes::node_type::element;
 
   return (PyObject *)self;
 }
 
+// Destroy the element and release the memory
+static void ElementNuBase_dealloc(ElementNuBase *self) {
+  using element_type = reactions::nubase_element;
+  self->element.~element_type();
+  Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
 /// Initialize the element
 static int ElementNuBase_init(ElementNuBase *self, PyObject *args,
                               PyObject *kwargs) {
@@ -322,6 +333,8 @@ static PyGetSetDef ElementNuBase_getsetters[] = {
     REACTIONS_PYTHON_ELEMENTNUBASE_GETTER_DESC(
         latex_name, "str: Representation of the name to be processed by LaTeX "
                     "(needs to be inserted inside a mathematical expression)"),
+    // sentinel
+    {NULL}
 };
 
 /// Type declaration
@@ -329,7 +342,7 @@ static PyTypeObject ElementNuBaseType = {
     PyVarObject_HEAD_INIT(NULL, 0) "reactions.nubase_element", /* tp_name */
     sizeof(ElementNuBase),                    /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    0,                                        /* tp_dealloc */
+    (destructor)ElementNuBase_dealloc, /* tp_dealloc */
     0,                                        /* tp_vectorcall_offset */
     0,                                        /* tp_getattr */
     0,                                        /* tp_setattr */
@@ -1,5 +1,6 @@
 #pragma once
 
+#include <new>
 #include <string>
 #include <tuple>
 #include <utility>
@@ -29,12 +30,22 @@ static PyObject *ElementPDG_new(PyTypeObject *type, PyObject *Py_UNUSED(args),
   if (!self)
     return NULL;
 
+  // The memory is zero-initialized, so the element must be constructed
+  new (&self->element) reactions::pdg_element{reactions::pdg_element::base_type{}};
+
   // Set the type for the base class
   self->node.c_type = reactions::processes::node_type::element;
 
   return (PyObject *)self;
 }
 
+// Destroy the element and release the memory
+static void ElementPDG_dealloc(ElementPDG *self) {
+  using element_type = reactions::pdg_element;
+  self->element.~element_type();
+  Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
 /// Initialize the element
 static int ElementPDG_init(ElementPDG *self, PyObject *args, PyObject *kwargs) {
 
@@ -307,6 +318,8 @@ static PyGetSetDef ElementPDG_getsetters[] = {
     REACTIONS_PYTHON_ELEMENTPDG_GETTER_DESC(
         latex_name, "str: Representation of the name to be processed by LaTeX "
                     "(needs to be inserted inside a mathematical expression)"),
+    // sentinel
+    {NULL}
 };
 
 /// Type declaration
@@ -314,7 +327,7 @@ static PyTypeObject ElementPDGType = {
     PyVarObject_HEAD_INIT(NULL, 0) "reactions.pdg_element", /* tp_name */
     sizeof(ElementPDG),                                     /* tp_basicsize */
     0,                                                      /* tp_itemsize */
-    0,                                                      /* tp_dealloc */
+    (destructor)ElementPDG_dealloc, /* tp_dealloc */
     0,                                        /* tp_vectorcall_offset */
     0,                                        /* tp_getattr */
     0,                                        /* tp_setattr */
@@ -1,5 +1,6 @@
 #pragma once
 
+#include <new>
 #include <string>
 
 #include "reactions/processes.hpp"
@@ -22,12 +23,22 @@ static PyObject *ElementString_new(PyTypeObject *type,
   if (!self)
     return NULL;
 
+  // The memory is zero-initialized, so the element must be constructed
+  new (&self->element) reactions::string_element{};
+
   // Set the type for the base class
   self->node.c_type = reactions::processes::node_type::element;
 
   return (PyObject *)self;
 }
 
+// Destroy the element and release the memory
+static void ElementString_dealloc(ElementString *self) {
+  using element_type = reactions::string_element;
+  self->element.~element_type();
+  Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
 /// Initialize the element
 static int ElementString_init(ElementString *self, PyObject *args,
                               PyObject *kwargs) {
@@ -54,6 +65,8 @@ static PyObject *ElementString_get_name(ElementString *self, void *) {
 static PyGetSetDef ElementString_getsetters[] = {
     {"name", (getter)ElementString_get_name, NULL, "str: Underlying name",
      NULL},
+    // sentinel
+    {NULL}
 };
 
 /// Represent the class as a string
@@ -83,7 +96,7 @@ static PyTypeObject ElementStringType = {
     PyVarObject_HEAD_INIT(NULL, 0) "reactions.string_element", /* tp_name */
     sizeof(ElementString),                    /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    0,                                        /* tp_dealloc */
+    (destructor)ElementString_dealloc, /* tp_dealloc */
     0,                                        /* tp_vectorcall_offset */
     0,                                        /* tp_getattr */
     0,                                        /* tp_setattr */
@@ -12,9 +12,9 @@ template <class SystemOfUnits> struct energy_units_accessor {
 
   /// Get the energy units
   static PyObject *get_energy_units(SystemOfUnits *self) {
-    return PyUnicode_FromString(reactions::energy_units_properties::to_string(
-                                    self->instance->get_energy_units())
-                                    .c_str());
+    return PyUnicode_FromString(
+        reactions::energy_units_properties::to_c_string(
+            self->instance->get_energy_units()));
   }
 
   /// Set the energy units
@@ -39,9 +39,9 @@ template <class SystemOfUnits> struct time_units_accessor {
 
   /// Get the time units
   static PyObject *get_time_units(SystemOfUnits *self) {
-    return PyUnicode_FromString(reactions::time_units_properties::to_string(
-                                    self->instance->get_time_units())
-                                    .c_str());
+    return PyUnicode_FromString(
+        reactions::time_units_properties::to_c_string(
+            self->instance->get_time_units()));
   }
 
   /// Set the time units
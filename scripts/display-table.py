@@ -3,13 +3,64 @@
 Compile a LaTeX document with the information of the available elements.
 """
 import argparse
-import math
+import concurrent.futures
 import os
 import reactions
+import shutil
 import subprocess
 import tempfile
 
 
+def format_float(v, prec=10):
+    """ Format a float, using scientific notation if necessary """
+    s = format(v, f'.{prec}g')
+    if 'e' in s:
+        m, e = s.split('e')
+        return f'\\({m} \\times 10^{{{int(e)}}}\\)'
+    return s
+
+
+def format_error(v):
+    """ Format a float representing an error """
+    return format_float(v, prec=2)
+
+
+# Functions to format the values of each field
+formatters = dict(
+    # common
+    name=lambda v: f'\\verb|{v}|',
+    latex_name=lambda v: f'\\({v}\\)',
+    # PDG element
+    pdg_id=lambda v: f'\\({v:+d}\\)',
+    three_charge=lambda v: f'\\({v:+d}\\)',
+    mass=format_float,
+    mass_error_lower=format_error,
+    mass_error_upper=format_error,
+    width=format_float,
+    width_error_lower=format_error,
+    width_error_upper=format_error,
+    is_self_cc=lambda v: 'true' if v else 'false',
+    # NuBase element
+    nubase_id=lambda v: f'\\({v:d}\\)',
+    atomic_number=lambda v: f'\\({v:+d}\\)',
+    mass_number=lambda v: f'\\({v:d}\\)',
+    mass_excess=format_float,
+    mass_excess_error=format_error,
+    mass_excess_from_systematics=lambda v: 'true' if v else 'false',
+    is_stable=lambda v: 'true' if v else 'false',
+    half_life=format_float,
+    half_life_error=format_error,
+    half_life_from_systematics=lambda v: 'true' if v else 'false',
+    is_ground_state=lambda v: 'true' if v else 'false',
+)
+
+
+def format_column(field, values):
+    """ Format the values of a column of the table """
+    fmt = formatters[field]
+    return [' ' if v is None else fmt(v) for v in values]
+
+
 if __name__ == '__main__':
 
     parser = argparse.ArgumentParser(description=__doc__)
@@ -33,62 +84,8 @@ if __name__ == '__main__':
 
     args = parser.parse_args()
 
-    # Get the table of particles
-    all_elements = args.database.all_elements()
-
-    def format_float(v, prec=10):
-        """ Format a float, using scientific notation if necessary """
-        av = abs(v)
-        if v == 0.:
-            return '0'
-        elif av > 100 or av < 0.01:
-            exp = int(math.floor(math.log10(av)))
-            s = f'{v / 10**exp:.{prec - 1}f}'
-            e = f'\\times 10^{{{exp}}}'
-            while s[-1] == '0':
-                s = s[:-1]
-            if s[-1] == '.':
-                s = s[:-1]
-            return f'\\({s} {e}\\)'
-        else:
-            s = f'{v:.{prec + 1}f}'
-            while s[-1:] == '0':
-                s = s[:-1]
-            if s[-1] == '.':
-                s = s[:-1]
-            return s
-
-    def format_error(v):
-        """ Format a float representing an error """
-        return format_float(v, prec=2)
-
-    formatters = dict(
-        # common
-        name=lambda v: f'\\verb|{v}|',
-        latex_name=lambda v: f'\\({v}\\)',
-        # PDG element
-        pdg_id=lambda v: f'\\({v:+d}\\)',
-        three_charge=lambda v: f'\\({v:+d}\\)',
-        mass=format_float,
-        mass_error_lower=format_error,
-        mass_error_upper=format_error,
-        width=format_float,
-        width_error_lower=format_error,
-        width_error_upper=format_error,
-        is_self_cc=lambda v: 'true' if v else 'false',
-        # NuBase element
-        nubase_id=lambda v: f'\\({v:d}\\)',
-        atomic_number=lambda v: f'\\({v:+d}\\)',
-        mass_number=lambda v: f'\\({v:d}\\)',
-        mass_excess=format_float,
-        mass_excess_error=format_error,
-        mass_excess_from_systematics=lambda v: 'true' if v else 'false',
-        is_stable=lambda v: 'true' if v else 'false',
-        half_life=format_float,
-        half_life_error=format_error,
-        half_life_from_systematics=lambda v: 'true' if v else 'false',
-        is_ground_state=lambda v: 'true' if v else 'false',
-    )
+    # Get the table of particles, one list of values per field
+    columns = args.database.columns(args.fields)
 
     titles = dict(
         # common
@@ -132,13 +129,6 @@ if __name__ == '__main__':
 
     with open(tmpfile, 'wt') as table_file:
 
-        body = ' & '.join(
-            f'\\textbf{{{titles[f]}}}' for f in args.fields) + f'\\\\{os.linesep}\\hline{os.linesep}'
-        for el in all_elements:
-            line = ' & '.join(' ' if getattr(el, f) is None else formatters[f](
-                getattr(el, f)) for f in args.fields)
-            body = f'{body}{line}\\\\{os.linesep}\\hline{os.linesep}'
-
         table_file.write(r'''\documentclass[12pt,a3paper]{{article}}
 \usepackage{{amsmath}}
 \usepackage{{pdflscape}}
@@ -155,17 +145,37 @@ if __name__ == '__main__':
 \vspace{{0.75cm}}
 \begin{{longtable}}{{{columns}}}
 \hline
-{body}
-\end{{longtable}}
-\end{{landscape}}
-\end{{document}}
-'''.format(columns='|c' * len(args.fields) + '|', body=body, title=args.title, subtitle=args.subtitle))
+'''.format(columns='|c' * len(args.fields) + '|', title=args.title, subtitle=args.subtitle))
+
+        end_of_row = f'\\\\{os.linesep}\\hline{os.linesep}'
+
+        table_file.write(' & '.join(
+            f'\\textbf{{{titles[f]}}}' for f in args.fields) + end_of_row)
+
+        # the columns are formatted in parallel
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            cells = list(executor.map(format_column, args.fields,
+                                      (columns[f] for f in args.fields)))
+
+        for row in zip(*cells):
+            table_file.write(' & '.join(row))
+            table_file.write(end_of_row)
+
+        table_file.write(r'''
+\end{longtable}
+\end{landscape}
+\end{document}
+''')
 
-    # run the command twice to process the references
-    subprocess.check_call([args.compiler, latex_name], cwd=tmpdir)
-    subprocess.check_call([args.compiler, latex_name], cwd=tmpdir)
+    # run the command twice to process the references; the first pass only
+    # needs to produce the auxiliary files (supported by pdfTeX and LuaTeX)
+    draft_mode = ['-draftmode'] if os.path.basename(
+        args.compiler) in ('pdflatex', 'lualatex') else []
+    subprocess.check_call([args.compiler, '-interaction=batchmode'] +
+                          draft_mode + [latex_name], cwd=tmpdir)
+    subprocess.check_call(
+        [args.compiler, '-interaction=batchmode', latex_name], cwd=tmpdir)
 
     if args.tmp_dir is None:
         # copy the PDF file from the temporary directory
-        subprocess.check_call(
-            ['cp', os.path.join(tmpdir, pdf_name), args.output])
+        shutil.copyfile(os.path.join(tmpdir, pdf_name), args.output)
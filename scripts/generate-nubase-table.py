@@ -5,7 +5,9 @@ becomes faster to read.
 """
 import argparse
 import datetime
+import operator
 import os
+import shutil
 import tempfile
 
 from urllib import request
@@ -22,6 +24,11 @@ HALF_LIFE = slice(69, 78)
 HALF_LIFE_UNIT = slice(78, 80)
 HALF_LIFE_ERROR = slice(81, 88)
 
+# extract all the fields of a line in a single call
+extract_fields = operator.itemgetter(MASS_NUMBER, ATOMIC_NUMBER, NAME, ISOMER,
+                                     MASS_EXCESS, MASS_EXCESS_ERROR, HALF_LIFE,
+                                     HALF_LIFE_UNIT, HALF_LIFE_ERROR)
+
 NAME_SIZE = 8  # size reserved for strings
 VALUE_SIZE = 16  # size reserved for values
 ERROR_SIZE = 9  # size reserved for errors
@@ -54,53 +61,60 @@ time_units['Zy'] = 1e21 * time_units['y']
 time_units['Yy'] = 1e24 * time_units['y']
 
 
+# format functions, built once from the sizes above
+_NAME_FORMAT = f'{{:>{NAME_SIZE}}}'.format
+_ID_FORMAT = f'{{:>{ID_SIZE}}}'.format
+_VALUE_FORMAT = f'{{:>{VALUE_SIZE}.{VALUE_SIZE - 7}e}}'.format
+_EMPTY_VALUE_FORMAT = f'{{:>{VALUE_SIZE}}}'.format
+_ERROR_FORMAT = f'{{:>{ERROR_SIZE}.1e}}'.format
+_EMPTY_ERROR_FORMAT = f'{{:>{ERROR_SIZE}}}'.format
+_BOOL_FORMAT = f'{{:>{BOOL_SIZE}}}'.format
+_AZ_FORMAT = f'{{:>{AZ_SIZE}}}'.format
+_NUBASE_ID_FORMAT = (3 * f'{{:0<{AZ_SIZE}}}').format
+
+
 def parse_name(name):
-    return f'{name:>{NAME_SIZE}}'
+    return _NAME_FORMAT(name)
 
 
 def parse_id(nubase_id):
-    return f'{int(nubase_id):>{ID_SIZE}}'
+    return _ID_FORMAT(int(nubase_id))
 
 
 def parse_value(value):
     if value:
-        return f'{float(value):>{VALUE_SIZE}.{VALUE_SIZE - 7}e}'
+        return _VALUE_FORMAT(float(value))
     else:
-        return f'{value:>{VALUE_SIZE}}'
+        return _EMPTY_VALUE_FORMAT(value)
 
 
 def parse_error(error):
     if error:
-        return f'{float(error):>{ERROR_SIZE}.1e}'
+        return _ERROR_FORMAT(float(error))
     else:
-        return f'{error:>{ERROR_SIZE}}'
+        return _EMPTY_ERROR_FORMAT(error)
 
 
 def parse_bool(value):
     if value:
-        return f'{int(value):>{BOOL_SIZE}}'
+        return _BOOL_FORMAT(int(value))
     else:
-        return f'{value:>{BOOL_SIZE}}'
+        return _BOOL_FORMAT(value)
 
 
 def parse_az(value):
-    return f'{int(value):>{AZ_SIZE}}'
+    return _AZ_FORMAT(int(value))
 
 
-FIELDS = [
-    ('name', parse_name),
-    ('nubase_id', parse_id),
-    ('atomic_number', parse_az),
-    ('mass_number', parse_az),
-    ('mass_excess', parse_value),
-    ('mass_excess_error', parse_error),
-    ('mass_excess_from_systematics', parse_bool),
-    ('is_stable', parse_bool),
-    ('half_life', parse_value),
-    ('half_life_error', parse_error),
-    ('half_life_from_systematics', parse_bool),
-    ('is_ground_state', parse_bool),
-]
+# formatters of the fields in the output table, in order: name, ID, atomic and
+# mass numbers, mass excess, its error and whether it comes from systematics,
+# stability flag, half life, its error and whether it comes from systematics
+# and ground-state flag
+FORMATTERS = (parse_name, parse_id, parse_az, parse_az,
+              parse_value, parse_error, parse_bool,
+              parse_bool,
+              parse_value, parse_error, parse_bool,
+              parse_bool)
 
 
 if __name__ == '__main__':
@@ -124,11 +138,13 @@ if __name__ == '__main__':
     if args.input_table is None:
         tmpdir = tempfile.TemporaryDirectory()
         input_table = os.path.join(tmpdir.name, 'nubase_table.txt')
-        request.urlretrieve(ONLINE_NUBASE_TABLE, input_table)
+        with request.urlopen(ONLINE_NUBASE_TABLE) as r, open(input_table, 'wb') as f:
+            shutil.copyfileobj(r, f, length=1 << 20)
     else:
-        input_table, input_pdg_table = args.input_table
+        input_table = args.input_table
 
-    with open(input_table) as input_file, open(args.output_table, 'wt') as output_file:
+    # the input table is read in binary mode, so only the fields used are decoded
+    with open(input_table, 'rb', buffering=1 << 20) as input_file, open(args.output_table, 'wt', buffering=1 << 20) as output_file:
 
         output_file.write(f'''*
 * Reactions particle table for NuBase elements, generated on {datetime.datetime.today().date()}
@@ -139,6 +155,9 @@ if __name__ == '__main__':
 *
 ''')
 
+        # lines of the table, written at once at the end
+        lines = []
+
         # Add additional stable particles
         for i, p in enumerate(('gamma', 'e-', 'e+')):
             if '+' in p:
@@ -148,30 +167,22 @@ if __name__ == '__main__':
             else:
                 atomic_number = 0
 
-            config = dict(
-                name=p,
-                nubase_id=i,
-                mass_number=0,
-                atomic_number=atomic_number,
-                mass_excess=0.,
-                mass_excess_error=0.,
-                mass_excess_from_systematics=False,
-                half_life=0.,
-                half_life_error=0.,
-                half_life_from_systematics=False,
-                is_ground_state=True,
-                is_stable=True,
-            )
-            output_file.write(
-                ' '.join(frmt(config[f]) for f, frmt in FIELDS) + os.linesep)
-
-        for line in filter(lambda s: not s.startswith('#'), input_file.readlines()):
-
-            base_name = line[NAME].strip()
-            isomer = line[ISOMER].strip()
-
-            mass_excess = line[MASS_EXCESS].strip()
-            mass_excess_error = line[MASS_EXCESS_ERROR].strip()
+            values = (p, i, atomic_number, 0,
+                      0., 0., False,
+                      True,
+                      0., 0., False,
+                      True)
+            lines.append(
+                ' '.join(f(v) for f, v in zip(FORMATTERS, values)) + '\n')
+
+        for line in input_file:
+
+            if line.startswith(b'#'):
+                continue
+
+            (mass_number, atomic_number, base_name, isomer, mass_excess,
+             mass_excess_error, half_life, half_life_units,
+             half_life_error) = (f.strip().decode() for f in extract_fields(line))
 
             if not mass_excess:
                 mass_excess_from_systematics = ''
@@ -183,10 +194,6 @@ if __name__ == '__main__':
                 else:
                     mass_excess_from_systematics = False
 
-            half_life = line[HALF_LIFE].strip()
-            half_life_units = line[HALF_LIFE_UNIT].strip()
-            half_life_error = line[HALF_LIFE_ERROR].strip()
-
             if half_life == 'stbl':
                 is_stable = True
                 half_life, half_life_error, half_life_from_systematics = '', '', ''
@@ -214,25 +221,16 @@ if __name__ == '__main__':
                 half_life_error = float(
                     half_life_error) * time_units[half_life_units]
 
-            mass_number = line[MASS_NUMBER].strip()
-            atomic_number = line[ATOMIC_NUMBER].strip()
-
-            nubase_id = f'{mass_number:0<{AZ_SIZE}}{atomic_number:0<{AZ_SIZE}}{ord(isomer or chr(0)):0<{AZ_SIZE}}'
-
-            config = dict(
-                name=f'{base_name}({isomer})' if isomer else base_name,
-                nubase_id=nubase_id,
-                mass_number=mass_number,
-                atomic_number=atomic_number,
-                is_stable=is_stable,
-                half_life=half_life,
-                half_life_error=half_life_error,
-                half_life_from_systematics=half_life_from_systematics,
-                mass_excess=mass_excess,
-                mass_excess_error=mass_excess_error,
-                mass_excess_from_systematics=mass_excess_from_systematics,
-                is_ground_state=not isomer,
-            )
-
-            output_file.write(
-                ' '.join(frmt(config[f]) for f, frmt in FIELDS) + os.linesep)
+            nubase_id = _NUBASE_ID_FORMAT(
+                mass_number, atomic_number, ord(isomer) if isomer else 0)
+
+            values = (f'{base_name}({isomer})' if isomer else base_name,
+                      nubase_id, atomic_number, mass_number,
+                      mass_excess, mass_excess_error, mass_excess_from_systematics,
+                      is_stable,
+                      half_life, half_life_error, half_life_from_systematics,
+                      not isomer)
+            lines.append(
+                ' '.join(f(v) for f, v in zip(FORMATTERS, values)) + '\n')
+
+        output_file.writelines(lines)
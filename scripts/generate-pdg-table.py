@@ -7,10 +7,13 @@ the charge-conjugate of the particles.
 """
 import argparse
 import datetime
+import functools
 import os
 import re
+import shutil
 import tempfile
 
+from collections import Counter
 from urllib import request
 
 ONLINE_PDG_TABLE = 'https://pdg.lbl.gov/2020/mcdata/mass_width_2020.mcd'
@@ -39,40 +42,81 @@ LENGTHS = (NAME_SIZE, ID_SIZE, THREE_CHARGE_SIZE, VALUE_SIZE, ERROR_SIZE,
            ERROR_SIZE, VALUE_SIZE, ERROR_SIZE, ERROR_SIZE, IS_SELF_CC_SIZE)
 
 
-def format_name(n):
-    """ Format the name """
-    return f'{n:>{NAME_SIZE}}'
-
-
-def format_id(i):
-    """ Format the PDG ID """
-    return f'{i:>{ID_SIZE}}'
-
-
-def format_three_charge(c):
-    """ Format the charge """
-    return f'{c:>{THREE_CHARGE_SIZE}}'
+# Format functions, built once from the sizes above. The measurements (mass, width and
+# their errors) are formatted once per PDG entry and written as a single field of the row.
+_ROW_FORMAT = f'{{:>{NAME_SIZE}}} {{:>{ID_SIZE}}} {{:>+{THREE_CHARGE_SIZE}d}} {{}} {{:>{IS_SELF_CC_SIZE}d}}\n'.format
+_VALUE_FORMAT = f'{{:>{VALUE_SIZE}.{VALUE_SIZE - 7}e}}'.format
+_ERROR_FORMAT = f'{{:>{ERROR_SIZE}.1e}}'.format
+_EMPTY_VALUE = VALUE_SIZE * ' '
+_EMPTY_ERROR = ERROR_SIZE * ' '
 
 
 def parse_value(v):
     """ Format a value (mass or width) """
     if v.strip():
-        return f'{float(v):>{VALUE_SIZE}.{VALUE_SIZE - 7}e}'
+        return _VALUE_FORMAT(float(v))
     else:
-        return VALUE_SIZE * ' '
+        return _EMPTY_VALUE
 
 
 def parse_error(e):
     """ Format an error """
     if e.strip():
-        return f'{abs(float(e)):>{ERROR_SIZE}.1e}'
+        return _ERROR_FORMAT(abs(float(e)))
+    else:
+        return _EMPTY_ERROR
+
+
+def format_measurements(line):
+    """ Format the mass, the width and their errors of a line of the PDG table """
+    # Note that the lower and upper errors are inverted with respect to the PDG
+    return ' '.join((parse_value(line[MASS_FIELD]),
+                     parse_error(line[MASS_ERROR_LOWER_FIELD]),
+                     parse_error(line[MASS_ERROR_UPPER_FIELD]),
+                     parse_value(line[WIDTH_FIELD]),
+                     parse_error(line[WIDTH_ERROR_LOWER_FIELD]),
+                     parse_error(line[WIDTH_ERROR_UPPER_FIELD])))
+
+
+def parse_int(s):
+    """ Parse an integer that might be missing """
+    return None if not s else int(s)
+
+
+def category_from_pid_(pid):
+    """ Determine the category of a particle from its PDG ID """
+    if pid % 10000 > 999:
+        return 'baryon'
+    elif pid % 1000 > 99:
+        return 'meson'
     else:
-        return ERROR_SIZE * ' '
+        return 'fundamental'
 
 
-def parse_is_self_cc(b):
-    """ Format the self-conjugate flag """
-    return f'{int(bool(b)):>{IS_SELF_CC_SIZE}}'
+def is_self_cc_meson(pid):
+    """ Whether the meson with the given PDG ID is its own charge-conjugate """
+    q1, q2 = pid % 100 // 10, pid % 1000 // 100
+    if q1 == q2:
+        return True
+    else:
+        return False
+
+
+def write_element_(name, pid, three_charge, measurements, is_self_cc, *, output_lines, new_particle_names):
+    """ Add the row of an element to the output lines """
+    output_lines.append(_ROW_FORMAT(
+        name, pid, three_charge, measurements, is_self_cc))
+    new_particle_names.append(name)
+
+
+def write_particle_and_antiparticle_(name, pid, three_charge, measurements, is_self_cc, particle_format, antiparticle_format, *, output_lines, new_particle_names):
+    """ Add the rows of a particle and its antiparticle to the output lines """
+    write_element_(particle_format.format(name=name, charge=CHARGE_NAME_FROM_THREE_CHARGE[three_charge]),
+                   pid, three_charge, measurements, is_self_cc,
+                   output_lines=output_lines, new_particle_names=new_particle_names)
+    write_element_(antiparticle_format.format(name=name, charge=CHARGE_NAME_FROM_THREE_CHARGE[-three_charge]),
+                   -pid, -three_charge, measurements, is_self_cc,
+                   output_lines=output_lines, new_particle_names=new_particle_names)
 
 
 CHARGE_FROM_PDG_CHARGE = {'0': 0,
@@ -85,52 +129,52 @@ CHARGE_FROM_PDG_CHARGE = {'0': 0,
                           '-': -1,
                           '--': -2}
 
+# Three times the charge, as an integer, for each PDG charge
+THREE_CHARGE_FROM_PDG_CHARGE = {k: int(round(3 * v))
+                                for k, v in CHARGE_FROM_PDG_CHARGE.items()}
 
-if __name__ == '__main__':
 
-    parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument('output_table', type=str, help='Output table')
-    parser.add_argument('--input-table', '-i', type=str, default=None,
-                        help='PDG database table. If it is not provided the table is downloaded from the internet')
-    parser.add_argument('--overwrite', '-w', action='store_true',
-                        help='If set, overwrite the output file, if existing')
-    args = parser.parse_args()
+def _charge_name(three_charge):
+    """ Suffix used in the name of an element with the given charge """
+    c = int(round(three_charge / 3.))
+    if c == 0:
+        return 0
+    else:
+        return abs(c) * '+' if c > 0 else abs(c) * '-'
+
 
-    # Order of the fields in the output table, together with the size reserved for them
-    # Nte that the lower and upper errors are inverted with respect to the PDG
-    FIELDS = (
-        ('name', format_name),
-        ('id', format_id),
-        ('three_charge', format_three_charge),
-        ('mass', parse_value),
-        ('mass_error_lower', parse_error),
-        ('mass_error_upper', parse_error),
-        ('width', parse_value),
-        ('width_error_lower', parse_error),
-        ('width_error_upper', parse_error),
-        ('is_self_cc', parse_is_self_cc),
-    )
+# Suffix used in the names for each possible value of three times the charge
+CHARGE_NAME_FROM_THREE_CHARGE = {t: _charge_name(t) for t in range(-6, 7)}
 
-    # commented line
-    commented_line = re.compile('^w*\*')
 
-    # components in parentheses
-    paranthesized = re.compile('\(([A-z]*|[0-9]*|[0-9][A-Z]|[a-z][0-9])\)')
+# commented line
+commented_line = re.compile(rb'^\s*\*')
 
-    # check if a base name is an uppercase character
-    re_uppercase_character = re.compile('^[A-Z](?!([A-z]|/))')
+# check if a base name is an uppercase character
+re_uppercase_character = re.compile(r'^[A-Z](?!([A-z]|/))')
 
-    # check if a base name is an lowercase character
-    re_lowercase_character = re.compile('^[a-z]')
+# check if a base name is an lowercase character
+re_lowercase_character = re.compile(r'^[a-z]')
 
-    # mass eigenstates of mesons
-    re_mass_eigenstate = re.compile('^[A-Z]\([A-Z]\)')
+# mass eigenstates of mesons
+re_mass_eigenstate = re.compile(r'^[A-Z]\([A-Z]\)')
 
-    # a flavoured baryon
-    re_is_flavoured_baryon = re.compile('^[A-z]*\([a-z]{1,}\)')
+# a flavoured baryon
+re_is_flavoured_baryon = re.compile(r'^[A-z]*\([a-z]{1,}\)')
 
-    # neutrinos need an special treatment
-    re_neutrino = re.compile('^nu\(')
+# neutrinos need an special treatment
+re_neutrino = re.compile(r'^nu\(')
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('output_table', type=str, help='Output table')
+    parser.add_argument('--input-table', '-i', type=str, default=None,
+                        help='PDG database table. If it is not provided the table is downloaded from the internet')
+    parser.add_argument('--overwrite', '-w', action='store_true',
+                        help='If set, overwrite the output file, if existing')
+    args = parser.parse_args()
 
     if not args.overwrite and os.path.exists(args.output_table):
         if os.path.isfile(args.output_table):
@@ -143,19 +187,31 @@ if __name__ == '__main__':
     if args.input_table is None:
         tmpdir = tempfile.TemporaryDirectory()
         input_table = os.path.join(tmpdir.name, 'pdg_table.txt')
-        request.urlretrieve(ONLINE_PDG_TABLE, input_table)
+        with request.urlopen(ONLINE_PDG_TABLE) as r, open(input_table, 'wb') as f:
+            shutil.copyfileobj(r, f, length=1 << 20)
     else:
         input_table = args.input_table
 
-    # store the particle names to check when we must add charges to the name
-    pdg_particle_names = []
-    with open(input_table) as input_file:
-        for line in filter(lambda s: not commented_line.match(s), input_file):
-            pdg_particle_names.append(
-                line[NAME_CHARGE_FIELD].split()[0].strip())
+    # the input table is small, so it is read only once; it is read in binary mode and
+    # only the fields used are decoded
+    with open(input_table, 'rb', buffering=1 << 20) as input_file:
+        input_lines = [l for l in input_file if not commented_line.match(l)]
+
+    # names and charges of the input lines, split only once
+    names_and_charges = [l[NAME_CHARGE_FIELD].decode().split()
+                         for l in input_lines]
+
+    # count the particle names to check when we must add charges to the name
+    pdg_particle_names = Counter(n for n, _ in names_and_charges)
 
     new_particle_names = []  # to check that there are unique names
-    with open(input_table) as input_file, open(args.output_table, 'wt') as output_file:
+    output_lines = []  # lines of the table, written at once at the end
+
+    write_element = functools.partial(
+        write_element_, output_lines=output_lines, new_particle_names=new_particle_names)
+    write_particle_and_antiparticle = functools.partial(
+        write_particle_and_antiparticle_, output_lines=output_lines, new_particle_names=new_particle_names)
+    with open(args.output_table, 'wt', buffering=1 << 20) as output_file:
 
         output_file.write(f'''*
 * Reactions particle table for PDG elements, generated on {datetime.datetime.today().date()}
@@ -165,161 +221,119 @@ if __name__ == '__main__':
 *
 ''')
 
-        def parse_int(s): return None if not s else int(s)
-
-        for line in filter(lambda s: not commented_line.match(s), input_file):
+        for line, (name, charge) in zip(input_lines, names_and_charges):
 
             # extract the information
             pids = tuple(parse_int(line[s].strip())
                          for s in PID_FIELDS)  # -, 0, +, ++
 
-            config = dict(
-                mass=line[MASS_FIELD],
-                mass_error_upper=line[MASS_ERROR_UPPER_FIELD],
-                mass_error_lower=line[MASS_ERROR_LOWER_FIELD],
-                width=line[WIDTH_FIELD],
-                width_error_upper=line[WIDTH_ERROR_UPPER_FIELD],
-                width_error_lower=line[WIDTH_ERROR_LOWER_FIELD],
-            )
-            name, charge = (s.strip() for s in line[107:128].split())
+            measurements = format_measurements(line)
 
             charges = charge.split(',')
 
-            def write_element_(config, name, three_charge, pid):
-                config = dict(config)
-                config['name'] = name
-                config['three_charge'] = f'{three_charge:+d}'
-                config['id'] = pid
-                output_file.write(
-                    ' '.join(f(config[s]) for s, f in FIELDS) + os.linesep)
-                new_particle_names.append(config['name'])
-
-            def write_particle_and_antiparticle_(config, pid, three_charge, particle_format, antiparticle_format):
-                for i, (t, p, f) in enumerate([(+three_charge, +pid, particle_format), (-three_charge, -pid, antiparticle_format)]):
-                    c = int(round(t / 3.))
-                    if c == 0:
-                        charge = 0
-                    else:
-                        charge = abs(c) * '+' if c > 0 else abs(c) * '-'
-                    write_element_(config, f.format(
-                        name=name, charge=charge), t, p)
-
-            def category_from_pid_(pid):
-                if pid % 10000 > 999:
-                    return 'baryon'
-                elif pid % 1000 > 99:
-                    return 'meson'
-                else:
-                    return 'fundamental'
-
-            def is_self_cc_meson(pid):
-                q1, q2 = pid % 100 // 10, pid % 1000 // 100
-                if q1 == q2:
-                    return True
-                else:
-                    return False
-
             if len(charges) == 1:
                 # we can use "charge"
-                three_charge = int(round(3 * CHARGE_FROM_PDG_CHARGE[charge]))
+                three_charge = THREE_CHARGE_FROM_PDG_CHARGE[charge]
 
                 pid = pids[0]
 
                 category = category_from_pid_(pid)
 
                 # change latter for baryons
-                config['is_self_cc'] = (three_charge == 0)
+                is_self_cc = (three_charge == 0)
 
                 # particle
                 if abs(three_charge) in (1, 2):  # is a quark
-                    write_particle_and_antiparticle_(
-                        config, pid, three_charge, particle_format='{name}', antiparticle_format='{name}~')
+                    write_particle_and_antiparticle(
+                        name, pid, three_charge, measurements, is_self_cc, particle_format='{name}', antiparticle_format='{name}~')
                 elif three_charge != 0:  # charged
                     if category == 'baryon':
                         if re_lowercase_character.match(name):  # p, p~
-                            write_particle_and_antiparticle_(
-                                config, pid, three_charge, particle_format='{name}', antiparticle_format='{name}~')
+                            write_particle_and_antiparticle(
+                                name, pid, three_charge, measurements, is_self_cc, particle_format='{name}', antiparticle_format='{name}~')
                         else:
-                            write_particle_and_antiparticle_(
-                                config, pid, three_charge, particle_format='{name}{charge}', antiparticle_format='{name}~{charge}')
+                            write_particle_and_antiparticle(
+                                name, pid, three_charge, measurements, is_self_cc, particle_format='{name}{charge}', antiparticle_format='{name}~{charge}')
                     else:  # meson or fundamental
-                        write_particle_and_antiparticle_(
-                            config, pid, three_charge, particle_format='{name}{charge}', antiparticle_format='{name}{charge}')
+                        write_particle_and_antiparticle(
+                            name, pid, three_charge, measurements, is_self_cc, particle_format='{name}{charge}', antiparticle_format='{name}{charge}')
                 else:  # neutral
                     if category == 'baryon':
 
-                        config['is_self_cc'] = False
+                        is_self_cc = False
 
-                        if pdg_particle_names.count(name) > 1 or re_is_flavoured_baryon.match(name):
-                            write_particle_and_antiparticle_(
-                                config, pid, three_charge, particle_format='{name}{charge}', antiparticle_format='{name}~{charge}')
+                        if pdg_particle_names[name] > 1 or re_is_flavoured_baryon.match(name):
+                            write_particle_and_antiparticle(
+                                name, pid, three_charge, measurements, is_self_cc, particle_format='{name}{charge}', antiparticle_format='{name}~{charge}')
                         else:
-                            write_particle_and_antiparticle_(
-                                config, pid, three_charge, particle_format='{name}', antiparticle_format='{name}~')
+                            write_particle_and_antiparticle(
+                                name, pid, three_charge, measurements, is_self_cc, particle_format='{name}', antiparticle_format='{name}~')
 
                     elif category == 'meson':
 
+                        is_mass_eigenstate = re_mass_eigenstate.match(name)
+
                         # K(S)0, K(L)0, ...
-                        if re_mass_eigenstate.match(name):
-                            config['is_self_cc'] = True
+                        if is_mass_eigenstate:
+                            is_self_cc = True
                         else:
-                            config['is_self_cc'] = is_self_cc_meson(pid)
+                            is_self_cc = is_self_cc_meson(pid)
 
                         # K(S)0, K(L)0, ...
-                        if re_mass_eigenstate.match(name):
-                            write_element_(
-                                config, f'{name}{charge}', three_charge, pid)
+                        if is_mass_eigenstate:
+                            write_element(
+                                f'{name}{charge}', pid, three_charge, measurements, is_self_cc)
                         # K, D, B, ...
                         elif re_uppercase_character.match(name):
-                            write_particle_and_antiparticle_(
-                                config, pid, three_charge, particle_format='{name}{charge}', antiparticle_format='{name}~{charge}')
+                            write_particle_and_antiparticle(
+                                name, pid, three_charge, measurements, is_self_cc, particle_format='{name}{charge}', antiparticle_format='{name}~{charge}')
                         # pi, ...
-                        elif pdg_particle_names.count(name) > 1:
-                            write_element_(
-                                config, f'{name}{charge}', three_charge, pid)
+                        elif pdg_particle_names[name] > 1:
+                            write_element(
+                                f'{name}{charge}', pid, three_charge, measurements, is_self_cc)
                         else:  # eta, phi, ...
-                            write_element_(config, name, three_charge, pid)
+                            write_element(name, pid, three_charge, measurements, is_self_cc)
 
                     else:  # fundamental
 
                         # H0, Z0, ...
                         if re_uppercase_character.match(name):
-                            write_element_(
-                                config, f'{name}{charge}', three_charge, pid)
+                            write_element(
+                                f'{name}{charge}', pid, three_charge, measurements, is_self_cc)
                         elif re_neutrino.match(name):  # nu_e, nu_mu, nu_tau
-                            config['is_self_cc'] = False
-                            write_particle_and_antiparticle_(
-                                config, pid, three_charge, particle_format=name, antiparticle_format='{name}~')
+                            is_self_cc = False
+                            write_particle_and_antiparticle(
+                                name, pid, three_charge, measurements, is_self_cc, particle_format=name, antiparticle_format='{name}~')
                         else:  # g, gamma, ...
-                            write_element_(config, name,
-                                           three_charge, pid)
+                            write_element(name, pid, three_charge, measurements, is_self_cc)
 
             else:
                 for charge, pid in zip(charges, pids):
 
-                    three_charge = int(
-                        round(3 * CHARGE_FROM_PDG_CHARGE[charge]))
+                    three_charge = THREE_CHARGE_FROM_PDG_CHARGE[charge]
 
                     if category == 'baryon':
 
-                        config['is_self_cc'] = False
-                        write_particle_and_antiparticle_(
-                            config, pid, three_charge, particle_format='{name}{charge}', antiparticle_format='{name}~{charge}')
+                        is_self_cc = False
+                        write_particle_and_antiparticle(
+                            name, pid, three_charge, measurements, is_self_cc, particle_format='{name}{charge}', antiparticle_format='{name}~{charge}')
 
                     elif category == 'meson':
 
-                        config['is_self_cc'] = is_self_cc_meson(pid)
+                        is_self_cc = is_self_cc_meson(pid)
 
                         if three_charge == 0:
-                            write_element_(
-                                config, f'{name}{charge}', three_charge, pid)
+                            write_element(
+                                f'{name}{charge}', pid, three_charge, measurements, is_self_cc)
                         else:
-                            write_particle_and_antiparticle_(
-                                config, pid, three_charge, particle_format='{name}{charge}', antiparticle_format='{name}{charge}')
+                            write_particle_and_antiparticle(
+                                name, pid, three_charge, measurements, is_self_cc, particle_format='{name}{charge}', antiparticle_format='{name}{charge}')
                     else:
                         raise RuntimeError(
                             'Unable to process fundamental particles with several associated PIDs')
 
+        output_file.writelines(output_lines)
+
     # check that particles are unique
     if len(new_particle_names) != len(set(new_particle_names)):
         repeated = [p.strip() for p in set(new_particle_names)
@@ -327,8 +341,6 @@ if __name__ == '__main__':
         raise RuntimeError(
             f'Particles do not have unique names: {repeated}. Output table is invalid.')
 
-    # reopen the table we just created to verify the length of the strings written in it
+    # verify the length of the lines written in the table
     line_size = len(LENGTHS) + sum(LENGTHS)  # account for the additional \n
-    with open(args.output_table) as table:
-        for line in filter(lambda s: not commented_line.match(s), table):
-            assert len(line) == line_size
+    assert all(len(line) == line_size for line in output_lines)
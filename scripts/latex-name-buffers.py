@@ -13,17 +13,21 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description=__doc__)
     parser.parse_args()  # no arguments
 
-    for name, database in ('PDG', reactions.pdg_database), ('NuBase', reactions.nubase_database):
-
-        all_elements = database.all_elements()
+    # translation table removing the superscript characters
+    remove_superscripts = str.maketrans('', '', '+-0*\'')
 
-        superscript_chars = ('+', '-', '0', '*', '\'')
+    for name, database in ('PDG', reactions.pdg_database), ('NuBase', reactions.nubase_database):
 
-        ratio = max([len(e.latex_name)/len(e.name) for e in all_elements])
+        # single pass over the elements computing all the quantities
+        ratio, ss = 0., 0
+        for e in database.all_elements():
+            element_name = e.name
+            ratio = max(ratio, len(e.latex_name) / len(element_name))
+            if name == 'PDG':
+                ss = max(ss, len(element_name) -
+                         len(element_name.translate(remove_superscripts)))
 
         if name == 'PDG':
-            ss = max([sum(e.name.count(s) for s in superscript_chars)
-                      for e in all_elements])
             additional = f'{os.linesep}- superscript size: {ss}'
         else:
             additional = ''
@@ -2,13 +2,15 @@
 Setup script for the "reactions" package
 """
 
+import functools
+import itertools
 import os
 import re
 import subprocess
-import tempfile
 import warnings
 
 from setuptools import Command, Extension, setup
+from setuptools.command.build_ext import build_ext
 
 PWD = os.path.abspath(os.path.dirname(__file__))
 
@@ -38,7 +40,20 @@ def files_with_extension(where, *exts):
     """
     Return all the files with the given extension in the package.
     """
-    return [os.path.join(root, f) for root, _, files in os.walk(where) for f in filter(lambda s: any(s.endswith(f'.{e}') for e in exts), files)]
+    suffixes = tuple(f'.{e}' for e in exts)
+
+    files = []
+
+    directories = [where]
+    while directories:
+        with os.scandir(directories.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif entry.name.endswith(suffixes):
+                    files.append(entry.path)
+
+    return files
 
 
 def python_files_in(d):
@@ -46,38 +61,60 @@ def python_files_in(d):
     return files_with_extension(d, 'py')
 
 
-def cpp_files_in(d):
-    """ C++ files in the given directory """
-    return files_with_extension(d, 'hpp', 'cpp', 'hpp.in')
+def python_and_cpp_files_in(d):
+    """ Python and C++ files in the given directory, found in a single walk """
+    python_files, cpp_files = [], []
+    for f in files_with_extension(d, 'py', 'hpp', 'cpp', 'hpp.in'):
+        if f.endswith('.py'):
+            python_files.append(f)
+        else:
+            cpp_files.append(f)
+    return python_files, cpp_files
 
 
+@functools.lru_cache(maxsize=None)
 def license_for_language(language):
     """
     Create the license string for the given language.
     """
     with open(os.path.join(PWD, 'LICENSE.txt')) as f:
-        lines = f.read().split(os.linesep)[:3]  # take the first paragraphs
+        # take the first paragraphs
+        lines = [l.rstrip('\n') for l in itertools.islice(f, 3)]
 
     if language == 'python':
 
         ml = max(map(len, lines)) + 2  # for the extra # and the whitespace
 
-        text = os.linesep.join(f'# {l}' if l else '#' for l in lines)
+        text = '\n'.join(f'# {l}' if l else '#' for l in lines)
 
-        return ml * '#' + f'{os.linesep}{text}{os.linesep}' + ml * '#' + os.linesep
+        return ml * '#' + f'\n{text}\n' + ml * '#' + '\n'
 
     elif language == 'cpp':
 
         ml = max(map(len, lines)) + 1
 
-        text = os.linesep.join(f' * {l}' if l else ' *' for l in lines)
+        text = '\n'.join(f' * {l}' if l else ' *' for l in lines)
 
-        return '/*' + ml * '*' + f'{os.linesep}{text}{os.linesep} ' + ml * '*' + f'*/{os.linesep}'
+        return '/*' + ml * '*' + f'\n{text}\n ' + ml * '*' + '*/\n'
 
     else:
         raise ValueError(f'Unknown programming language "{language}"')
 
 
+@functools.lru_cache(maxsize=None)
+def directories_matching(regex):
+    """
+    Directories in the root of the package whose name matches the given
+    regular expression. The result is shared by all the commands run in
+    the same invocation.
+    """
+    m = re.compile(regex)
+
+    with os.scandir(PWD) as it:
+        return tuple(entry.path for entry in it
+                     if entry.is_dir() and m.match(entry.name) is not None)
+
+
 class DirectoryWorker(Command):
 
     user_options = [
@@ -98,10 +135,7 @@ class DirectoryWorker(Command):
         if self.regex is None:
             raise Exception('Parameter --regex is missing')
 
-        m = re.compile(self.regex)
-
-        self.directories = list(os.path.join(PWD, d) for d in filter(
-            lambda s: os.path.isdir(s) and (m.match(s) is not None), os.listdir(PWD)))
+        self.directories = directories_matching(self.regex)
 
         if len(self.directories) == 0:
             warnings.warn('Empty list of directories', RuntimeWarning)
@@ -115,33 +149,36 @@ class ApplyFormatCommand(DirectoryWorker):
         """
         Execution of the command action.
         """
+        # collect the files of all the directories, so each tool runs only once
+        python_files, c_files = [], []
         for directory in self.directories:
+            py, cpp = python_and_cpp_files_in(directory)
+            python_files += py
+            c_files += cpp
+
+        # Format the python files
+        python_proc = None if not python_files else subprocess.Popen(
+            ['autopep8', '-i'] + python_files)
+
+        # Format C files
+        c_proc = None if not c_files else subprocess.Popen(
+            ['clang-format', '-i'] + c_files)
+
+        def killall():
+            if python_proc is not None:
+                python_proc.kill()
+            if c_proc is not None:
+                c_proc.kill()
+
+        # Wait for the processes to finish
+        if python_proc is not None and python_proc.wait() != 0:
+            killall()
+            raise RuntimeError(
+                'Problems found while formatting python files')
 
-            # Format the python files
-            python_files = python_files_in(directory)
-            python_proc = None if not python_files else subprocess.Popen(
-                ['autopep8', '-i'] + python_files)
-
-            # Format C files
-            c_files = cpp_files_in(directory)
-            c_proc = None if not c_files else subprocess.Popen(
-                ['clang-format', '-i'] + c_files)
-
-            def killall():
-                if python_proc is not None:
-                    python_proc.kill()
-                if c_proc is not None:
-                    c_proc.kill()
-
-            # Wait for the processes to finish
-            if python_proc is not None and python_proc.wait() != 0:
-                killall()
-                raise RuntimeError(
-                    'Problems found while formatting python files')
-
-            if c_proc is not None and c_proc.wait() != 0:
-                killall()
-                raise RuntimeError('Problems found while formatting C files')
+        if c_proc is not None and c_proc.wait() != 0:
+            killall()
+            raise RuntimeError('Problems found while formatting C files')
 
 
 class CheckFormatCommand(DirectoryWorker):
@@ -153,8 +190,7 @@ class CheckFormatCommand(DirectoryWorker):
         Execution of the command action.
         """
         for directory in self.directories:
-            python_files = python_files_in(directory)
-            c_files = cpp_files_in(directory)
+            python_files, c_files = python_and_cpp_files_in(directory)
 
             # Check python files
             process = subprocess.Popen(['autopep8', '--diff'] + python_files,
@@ -163,14 +199,17 @@ class CheckFormatCommand(DirectoryWorker):
 
             check_format_process('autopep8', directory, process)
 
-            # Check the C files
-            for fl in c_files:
-                process = subprocess.Popen(['clang-format', fl],
+            # Check the C files, all of them with a single process
+            if c_files:
+                process = subprocess.Popen(['clang-format', '--dry-run', '--Werror'] + c_files,
                                            stdout=subprocess.PIPE,
                                            stderr=subprocess.PIPE)
-                with open(fl) as f:
-                    check_format_process(
-                        'clang-format', directory, process, compare=f.read())
+
+                _, stderr = process.communicate()
+
+                if process.returncode != 0:
+                    raise RuntimeError(
+                        f'Found problems for files in directory "{directory}":{os.linesep}{stderr.decode()}')
 
 
 class CheckPyFlakesCommand(DirectoryWorker):
@@ -196,52 +235,100 @@ class CheckPyFlakesCommand(DirectoryWorker):
                     f'PyFlakes failed to process files:{os.linesep}{files}')
 
 
-with tempfile.TemporaryDirectory() as tmp_include_dir:
+class BuildExtCommand(build_ext):
+
+    def finalize_options(self):
+        """
+        Running at the end of the configuration. Unless a build base or a
+        temporary directory are given, object files are placed in the source
+        tree, so they survive between invocations.
+        """
+        super().finalize_options()
+
+        given = set(self.distribution.get_option_dict('build')) | set(
+            self.distribution.get_option_dict('build_ext'))
 
-    # so the "include" statements work properly
-    os.mkdir(os.path.join(tmp_include_dir, 'reactions'))
+        if not given & {'build_base', 'build_temp'}:
+            self.build_temp = os.path.join(
+                PWD, 'build', os.path.basename(self.build_temp))
 
-    # modify headers that need to be configured
+
+def configure_headers(output_dir):
+    """
+    Configure the headers that need it, writing them in the given directory.
+    Headers are only rewritten if the input file has changed, and they keep
+    the modification time of the input file, so the extension is not rebuilt
+    when they have not changed.
+    """
+    os.makedirs(os.path.join(output_dir, 'reactions'), exist_ok=True)
+
+    # placeholders of the paths to the tables, which are specified at the python level
+    table_placeholder = re.compile(r'@[A-Z]*_TABLE@')
+
+    output_filenames = []
     for input_filename in files_with_extension(os.path.join(PWD, 'include'), 'hpp.in'):
+
         output_filename = os.path.join(
-            tmp_include_dir, 'reactions', os.path.basename(input_filename[:-3]))
+            output_dir, 'reactions', os.path.basename(input_filename[:-3]))
+
+        output_filenames.append(output_filename)
+
+        input_stat = os.stat(input_filename)
+
+        if os.path.exists(output_filename) and os.stat(output_filename).st_mtime == input_stat.st_mtime:
+            continue
+
         with open(input_filename) as input_file, open(output_filename, 'wt') as output_file:
-            # this is specified at the python level
-            output_file.write(re.sub('@[A-Z]*_TABLE@', '', input_file.read()))
+            output_file.write(table_placeholder.sub('', input_file.read()))
+
+        os.utime(output_filename, (input_stat.st_atime, input_stat.st_mtime))
+
+    return output_filenames
+
+
+# directory where the configured headers are written (so the "include" statements work properly)
+configured_include_dir = os.path.join(PWD, 'build', 'gen_include')
+
+configured_headers = configure_headers(configured_include_dir)
 
-    # setup function
-    setup(
+# setup function
+setup(
 
-        name='reactions',
+    name='reactions',
 
-        description='Package to define and handle reactions and decays',
+    description='Package to define and handle reactions and decays',
 
-        cmdclass={'apply_format': ApplyFormatCommand,
-                  'check_format': CheckFormatCommand,
-                  'check_pyflakes': CheckPyFlakesCommand},
+    cmdclass={'build_ext': BuildExtCommand,
+              'apply_format': ApplyFormatCommand,
+              'check_format': CheckFormatCommand,
+              'check_pyflakes': CheckPyFlakesCommand},
 
-        # Read the long description from the README
-        long_description=open(os.path.join(PWD, 'README.md')).read(),
+    # Read the long description from the README
+    long_description=open(os.path.join(PWD, 'README.md')).read(),
 
-        # Keywords to search for the package
-        keywords='hep high energy physics database',
+    # Keywords to search for the package
+    keywords='hep high energy physics database',
 
-        # Set the path to the python package
-        packages=['reactions'],
-        package_dir={'': 'python'},
-        include_package_data=True,
+    # Set the path to the python package
+    packages=['reactions'],
+    package_dir={'': 'python'},
+    include_package_data=True,
 
-        # Modules
-        ext_modules=[Extension('reactions.capi',
-                               include_dirs=[tmp_include_dir,
-                                             'include', os.path.join(PWD, 'python', 'src')],
-                               sources=[os.path.relpath(s, PWD) for s in files_with_extension(
-                                   os.path.join(PWD, 'python', 'src'), 'cpp')],
-                               extra_compile_args=['-std=c++17'],
-                               language='c++')],
+    # Modules
+    ext_modules=[Extension('reactions.capi',
+                           include_dirs=[configured_include_dir,
+                                         'include', os.path.join(PWD, 'python', 'src')],
+                           sources=[os.path.relpath(s, PWD) for s in files_with_extension(
+                               os.path.join(PWD, 'python', 'src'), 'cpp')],
+                           depends=configured_headers +
+                           files_with_extension(os.path.join(PWD, 'include'), 'hpp') +
+                           files_with_extension(os.path.join(
+                               PWD, 'python', 'src'), 'hpp'),
+                           extra_compile_args=['-std=c++17'],
+                           language='c++')],
 
-        # Python version
-        python_requires='>=3.6',
+    # Python version
+    python_requires='>=3.6',
 
-        tests_require=['pytest', 'pytest-runner'],
-    )
+    tests_require=['pytest', 'pytest-runner'],
+)
@@ -6,6 +6,7 @@ the python and CMake parts coincide.
 Since the python versions can contain development flags (e.g. v1.0.2dev0)
 only version, revision and patch numbers are checked.
 """
+import collections
 import os
 import re
 import subprocess
@@ -29,32 +30,55 @@ if __name__ == '__main__':
     os.makedirs(build_dir, exist_ok=True)
 
     print('Invoking cmake')
-    cmake_output = subprocess.check_output(['cmake', '..', f'-DCMAKE_CXX_COMPILER={env["CXX"]}'],
-                                           cwd=build_dir,
-                                           env=env,
-                                           stderr=subprocess.STDOUT,
-                                           encoding='utf-8')
+    cmake_process = subprocess.Popen(['cmake', '..', f'-DCMAKE_CXX_COMPILER={env["CXX"]}'],
+                                     cwd=build_dir,
+                                     env=env,
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.STDOUT,
+                                     bufsize=1,
+                                     encoding='utf-8')
 
     # check the CMake version
     sys.path.append(os.path.join(root, 'python'))
     import reactions
 
     version_line_finder = re.compile('^-- Found.*')
-    version_finder = re.compile('[0-9]*\.[0-9]*\.[0-9]*')
+    version_finder = re.compile(r'[0-9]*\.[0-9]*\.[0-9]*')
 
-    for line in cmake_output.split(os.linesep):
+    # the output is processed while CMake runs, stopping at the version line
+    for line in cmake_process.stdout:
         if version_line_finder.match(line):
             cmake_version = version_finder.search(line)
             if not cmake_version:
+                cmake_process.kill()
                 raise LookupError('Unable to extract version for CMake')
             if not reactions.__version__.startswith(cmake_version.group()):
+                cmake_process.kill()
                 raise RuntimeError(
                     f'Python and CMake versions differ: python={reactions.__version__}, cmake={cmake_version.group()}')
             break
 
+    # consume the remaining output and wait for CMake to finish
+    cmake_process.communicate()
+    if cmake_process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            cmake_process.returncode, cmake_process.args)
+
     print('Invoking make')
-    subprocess.check_call(['make'], cwd=build_dir, env=env,
-                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    make_process = subprocess.Popen(['make', f'-j{os.cpu_count()}'],
+                                    cwd=build_dir,
+                                    env=env,
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT,
+                                    encoding='utf-8')
+
+    # only the last lines of the output are kept, and displayed if make fails
+    make_output = collections.deque(make_process.stdout, maxlen=100)
+    if make_process.wait() != 0:
+        print(''.join(make_output), end='')
+        raise subprocess.CalledProcessError(
+            make_process.returncode, make_process.args)
+
     print('Run application')
     subprocess.check_call(['./main'], cwd=build_dir, env=env)
     print('Success!')
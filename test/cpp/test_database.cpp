@@ -50,6 +50,42 @@ int main() {
 
     return errors;
   });
+  pdg_database_coll.add_test_function(
+      "test element iteration", []() -> test::errors {
+        test::errors errors;
+
+        try {
+
+          auto &db = pdg_database::instance();
+
+          for (auto status : {true, false}) {
+
+            if (status)
+              db.enable_cache();
+            else
+              db.disable_cache();
+
+            auto const all_elements = db.all_elements();
+
+            std::size_t count = 0;
+            db.for_each_element([&](pdg_element const &el) {
+              if (count >= all_elements.size() ||
+                  el.pdg_id() != all_elements[count].pdg_id())
+                errors.push_back(
+                    "Iterating over the elements does not visit the same "
+                    "elements as all_elements");
+              ++count;
+            });
+
+            if (count != all_elements.size())
+              errors.push_back("Iterating over the elements does not visit "
+                               "all the elements");
+          }
+        }
+        REACTIONS_TEST_UTILS_CATCH_EXCEPTIONS(errors);
+
+        return errors;
+      });
   pdg_database_coll.add_test_function(
       "test user elements", []() -> test::errors {
         test::errors errors;
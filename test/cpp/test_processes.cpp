@@ -38,6 +38,41 @@ template <class Element> struct decay_tester {
   }
 };
 
+template <class Element, class Process> struct comparison_tester {
+  const char *first;
+  const char *second;
+  bool expected;
+  test::errors operator()() const {
+    test::errors errors;
+    try {
+      auto f = processes::make_process<Process>(
+          first, element_traits::builder<Element>);
+      auto s = processes::make_process<Process>(
+          second, element_traits::builder<Element>);
+
+      if (!(f == f))
+        errors.push_back("Process is not equal to itself");
+      if ((f == s) != expected)
+        errors.push_back(expected ? "Processes must be equal"
+                                  : "Processes must be different");
+      if ((f != s) == expected)
+        errors.push_back("Inconsistent inequality operator");
+    }
+    REACTIONS_TEST_UTILS_CATCH_EXCEPTIONS(errors);
+
+    return errors;
+  }
+};
+
+/// Compare two reactions
+template <class Element>
+using reaction_comparison_tester =
+    comparison_tester<Element, reaction<Element>>;
+
+/// Compare two decays
+template <class Element>
+using decay_comparison_tester = comparison_tester<Element, decay<Element>>;
+
 int main() {
 
   // Test the reaction class
@@ -86,8 +121,49 @@ int main() {
   REACTIONS_TEST_UTILS_ADD_TEST(decay_coll,
                                 decay_tester<nubase_element>{"1n -> 1H e-"});
 
+  // Test the comparison operators
+  test::collector comparison_coll("comparison tests");
+  REACTIONS_TEST_UTILS_ADD_TEST(
+      comparison_coll, (reaction_comparison_tester<string_element>{
+                           "A B -> C D", "B A -> D C", true}));
+  REACTIONS_TEST_UTILS_ADD_TEST(
+      comparison_coll, (reaction_comparison_tester<string_element>{
+                           "A B -> C D", "C D -> A B", false}));
+  REACTIONS_TEST_UTILS_ADD_TEST(
+      comparison_coll, (reaction_comparison_tester<string_element>{
+                           "A A -> B C", "A B -> A C", false}));
+  REACTIONS_TEST_UTILS_ADD_TEST(
+      comparison_coll, (reaction_comparison_tester<string_element>{
+                           "A B -> {C -> D E} {C -> D F}",
+                           "B A -> {C -> F D} {C -> E D}", true}));
+  REACTIONS_TEST_UTILS_ADD_TEST(
+      comparison_coll, (reaction_comparison_tester<string_element>{
+                           "A B -> {C -> D E} F", "A B -> {C -> D F} E",
+                           false}));
+  REACTIONS_TEST_UTILS_ADD_TEST(
+      comparison_coll, (reaction_comparison_tester<pdg_element>{
+                           "p p~ -> {pi+ -> mu+ nu(mu)} pi-",
+                           "p~ p -> pi- {pi+ -> nu(mu) mu+}", true}));
+  REACTIONS_TEST_UTILS_ADD_TEST(
+      comparison_coll, (reaction_comparison_tester<pdg_element>{
+                           "pi+ -> mu+ nu(mu)", "pi+ -> nu(mu)~ mu-", false}));
+  REACTIONS_TEST_UTILS_ADD_TEST(
+      comparison_coll, (decay_comparison_tester<string_element>{
+                           "K(S)0 -> {pi+ -> mu+ nu(mu)} pi-",
+                           "K(S)0 -> pi- {pi+ -> nu(mu) mu+}", true}));
+  REACTIONS_TEST_UTILS_ADD_TEST(
+      comparison_coll, (decay_comparison_tester<string_element>{
+                           "A -> {B -> C D} B", "A -> {B -> C B} D", false}));
+  REACTIONS_TEST_UTILS_ADD_TEST(
+      comparison_coll, (decay_comparison_tester<nubase_element>{
+                           "1n -> 1H e-", "1n -> e- 1H", true}));
+  REACTIONS_TEST_UTILS_ADD_TEST(
+      comparison_coll, (decay_comparison_tester<pdg_element>{
+                           "pi+ -> mu+ nu(mu)", "pi- -> mu- nu(mu)~", false}));
+
   auto reaction_status = !reaction_coll.run();
   auto decay_status = !decay_coll.run();
+  auto comparison_status = !comparison_coll.run();
 
-  return reaction_status || decay_status;
+  return reaction_status || decay_status || comparison_status;
 }
@@ -9,6 +9,38 @@ def check_is_singleton(sgl):
     assert sgl() is sgl()
 
 
+@functools.lru_cache(maxsize=None)
+def all_nubase_elements():
+    """
+    Elements in the NuBase database file, read once for all the tests
+    """
+    return tuple(reactions.nubase_database.all_elements())
+
+
+@functools.lru_cache(maxsize=None)
+def all_pdg_elements():
+    """
+    Elements in the PDG database file, read once for all the tests
+    """
+    return tuple(reactions.pdg_database.all_elements())
+
+
+@functools.lru_cache(maxsize=None)
+def cached_nubase_element(name_or_id):
+    """
+    Get a NuBase element from the database, built only once for all the tests
+    """
+    return reactions.nubase_element(name_or_id)
+
+
+@functools.lru_cache(maxsize=None)
+def cached_pdg_element(name_or_id):
+    """
+    Get a PDG element from the database, built only once for all the tests
+    """
+    return reactions.pdg_element(name_or_id)
+
+
 def restore_database(database):
     """
     Decorate a function and restore a database path on exit, and clear the
@@ -21,7 +53,8 @@ def restore_database(database):
             try:
                 output = function(*args, **kwargs)
             finally:  # if the function fails we keep having a valid database
-                database.set_database_path(db)
+                if database.get_database_path() != db:
+                    database.set_database_path(db)
                 database.clear_cache()
             return output
         return _wrapper
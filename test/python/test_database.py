@@ -1,12 +1,20 @@
 """
 Test the properties of the database objects
 """
+import operator
 import pytest
 import reactions
 
 import helpers
 
 
+# arguments to register custom elements
+NUBASE_997UN_ARGS = ("997Un", 999997000, 999, 997, None, True, None, False)
+NUBASE_999UN_ARGS = ("999Un", 999999000, 999, 999, None, True, None, False)
+PDG_Z0P_ARGS = ("Z0'", 9999999, 0, None, None, True)
+PDG_Z0PPP_ARGS = ("Z0'''", 99999997, 0, None, None, True)
+
+
 def test_nubase_database():
     helpers.check_is_singleton(reactions.nubase_database_sgl)
 
@@ -15,19 +23,29 @@ def test_pdg_database():
     helpers.check_is_singleton(reactions.pdg_database_sgl)
 
 
-def check_unique_elements(db, id_accessor):
-    all_elements = db.all_elements()
-    assert len({e.name for e in all_elements}) == len(all_elements)
-    assert len({getattr(e, id_accessor)
-                for e in all_elements}) == len(all_elements)
+def check_unique_elements(all_elements, id_accessor):
+    get_id = operator.attrgetter(id_accessor)
+    names, ids = set(), set()
+    for e in all_elements:
+        name, i = e.name, get_id(e)
+        assert name not in names, f'Repeated name "{name}"'
+        assert i not in ids, f'Repeated ID {i}'
+        names.add(name)
+        ids.add(i)
+
+
+def check_access_by_name_and_id(db, id_accessor):
+    columns = db.columns(['name', id_accessor])
+    for name, i in zip(columns['name'], columns[id_accessor]):
+        assert db(name) == db(i)
 
 
 def test_nubase_unique_elements():
-    check_unique_elements(reactions.nubase_database, 'nubase_id')
+    check_unique_elements(helpers.all_nubase_elements(), 'nubase_id')
 
 
 def test_pdg_unique_elements():
-    check_unique_elements(reactions.pdg_database, 'pdg_id')
+    check_unique_elements(helpers.all_pdg_elements(), 'pdg_id')
 
 
 def check_getter_setter(db, db_sgl):
@@ -55,33 +73,53 @@ def test_pdg_getter_setter():
     check_getter_setter(reactions.pdg_database, reactions.pdg_database_sgl)
 
 
-def check_cache(db):
+def check_cache(db, all_elements):
     path = db.get_database_path()
-    nels = len(db.all_elements())
     db.enable_cache()
-    assert nels == len(db.all_elements())
+    assert len(all_elements) == len(db.all_elements())
     db.set_database_path(path)
 
 
 @helpers.restore_nubase_database
 def test_nubase_database_cache():
-    check_cache(reactions.nubase_database)
+    check_cache(reactions.nubase_database, helpers.all_nubase_elements())
 
 
 @helpers.restore_pdg_database
 def test_pdg_database_cache():
-    check_cache(reactions.pdg_database)
+    check_cache(reactions.pdg_database, helpers.all_pdg_elements())
+
+
+def check_lazy_reload(db):
+    path = db.get_database_path()
+    db.enable_cache()
+    db.set_database_path('non_existing_path')  # the file is not read here
+    with pytest.raises(reactions.DatabaseError):
+        db.all_elements()
+    db.set_database_path(path)
+    nels = len(db.all_elements())
+    db.disable_cache()
+    assert nels == len(db.all_elements())
 
 
 @helpers.restore_nubase_database
-def test_nubase_user_register():
+def test_nubase_lazy_reload():
+    check_lazy_reload(reactions.nubase_database)
+
 
-    for db in helpers.toggle_database_cache_status(reactions.nubase_database, clear_user_cache=False):
-        for el in db.all_elements():
-            assert db(el.name) == db(el.nubase_id)
+@helpers.restore_pdg_database
+def test_pdg_lazy_reload():
+    check_lazy_reload(reactions.pdg_database)
+
+
+@helpers.restore_nubase_database
+def test_nubase_user_register():
 
     for db in helpers.toggle_database_cache_status(reactions.nubase_database, clear_user_cache=True):
 
+        # no user elements are registered at this point
+        check_access_by_name_and_id(db, 'nubase_id')
+
         n = reactions.nubase_element(name="999Un", nubase_id=999999000, atomic_number=999, mass_number=999,
                                      mass_excess_and_error_with_tag=None, is_stable=False, half_life_and_error_with_tag=None, is_ground_state=True)
         db.register_element(n)
@@ -90,30 +128,19 @@ def test_nubase_user_register():
 
         reactions.nubase_element(name="998Un", nubase_id=999998000, atomic_number=999, mass_number=998,
                                  mass_excess_and_error_with_tag=None, is_stable=False, half_life_and_error_with_tag=None, is_ground_state=True)
-        db.register_element("997Un", 999997000, 999, 997,
-                            None, True, None, False)
-
-        with pytest.raises(reactions.DatabaseError):  # existing name
-            db.register_element("999Un", 999996000, 999, 999,
-                                None, True, None, False)
+        db.register_element(*NUBASE_997UN_ARGS)
 
-        with pytest.raises(reactions.DatabaseError):  # existing NuBase ID
-            db.register_element("996Un", 999999000, 999, 996,
-                                None, True, None, False)
-
-        for el in db.all_elements():
-            assert db(el.name) == db(el.nubase_id)
+        check_access_by_name_and_id(db, 'nubase_id')
 
 
 @helpers.restore_pdg_database
 def test_pdg_user_register():
 
-    for db in helpers.toggle_database_cache_status(reactions.pdg_database, clear_user_cache=False):
-        for el in db.all_elements():
-            assert db(el.name) == db(el.pdg_id)
-
     for db in helpers.toggle_database_cache_status(reactions.pdg_database, clear_user_cache=True):
 
+        # no user elements are registered at this point
+        check_access_by_name_and_id(db, 'pdg_id')
+
         z = reactions.pdg_element(name="Z0'", pdg_id=9999999, three_charge=0,
                                   mass_and_errors=None, width_and_errors=None, is_self_cc=True)
         db.register_element(z)
@@ -122,19 +149,73 @@ def test_pdg_user_register():
 
         db.register_element(name="Z0''", pdg_id=9999998, three_charge=0,
                             mass_and_errors=None, width_and_errors=None, is_self_cc=True)
-        db.register_element("Z0'''", 99999997, 0, None, None, True)
+        db.register_element(*PDG_Z0PPP_ARGS)
 
-        with pytest.raises(reactions.DatabaseError):  # existing name
-            db.register_element("Z0", 99999996, 0, None, None, True)
+        check_access_by_name_and_id(db, 'pdg_id')
 
-        with pytest.raises(reactions.DatabaseError):  # existing PDG ID
-            db.register_element("Z0''''", 1, 0, None, None, True)
 
-        for el in db.all_elements():
-            assert db(el.name) == db(el.pdg_id)
+@pytest.mark.parametrize('name,nubase_id', [
+    ('999Un', 999996000),  # existing name (registered by the user)
+    ('996Un', 999999000),  # existing NuBase ID (registered by the user)
+    ('1H', 999996000),  # existing name (in the database)
+    ('996Un', 1001000),  # existing NuBase ID (in the database)
+])
+@helpers.restore_nubase_database
+def test_nubase_register_duplicate(name, nubase_id):
+    for db in helpers.toggle_database_cache_status(reactions.nubase_database, clear_user_cache=True):
+        db.register_element(*NUBASE_999UN_ARGS)
+        with pytest.raises(reactions.DatabaseError):
+            db.register_element(name, nubase_id, 999, 996,
+                                None, True, None, False)
+
 
+@pytest.mark.parametrize('name,pdg_id', [
+    ("Z0'", 99999996),  # existing name (registered by the user)
+    ("Z0''''", 9999999),  # existing PDG ID (registered by the user)
+    ('Z0', 99999996),  # existing name (in the database)
+    ("Z0''''", 1),  # existing PDG ID (in the database)
+])
+@helpers.restore_pdg_database
+def test_pdg_register_duplicate(name, pdg_id):
+    for db in helpers.toggle_database_cache_status(reactions.pdg_database, clear_user_cache=True):
+        db.register_element(*PDG_Z0P_ARGS)
+        with pytest.raises(reactions.DatabaseError):
+            db.register_element(name, pdg_id, 0, None, None, True)
 
-def test_pdg_charge_conjugate():
-    for pa, cc in ('K(S)0', 'K(S)0'), ('pi+', 'pi-'), ('p', 'p~'), ('Lambda', 'Lambda~'):
-        f, s = reactions.pdg_database(pa), reactions.pdg_database(cc)
-        assert reactions.pdg_database.charge_conjugate(f) == s
+
+@pytest.mark.parametrize('particle,antiparticle', [
+    ('K(S)0', 'K(S)0'),
+    ('pi+', 'pi-'),
+    ('p', 'p~'),
+    ('Lambda', 'Lambda~'),
+])
+def test_pdg_charge_conjugate(particle, antiparticle):
+    f = helpers.cached_pdg_element(particle)
+    s = helpers.cached_pdg_element(antiparticle)
+    assert reactions.pdg_database.charge_conjugate(f) == s
+
+
+def check_columns(db, fields):
+    all_elements = db.all_elements()
+    columns = db.columns(fields)
+    assert list(columns) == fields
+    for f in fields:
+        assert columns[f] == [getattr(e, f) for e in all_elements]
+    with pytest.raises(reactions.ValueError):
+        db.columns(['unknown_field'])
+    with pytest.raises(reactions.ValueError):
+        db.columns(['name', 'name'])
+    with pytest.raises(TypeError):
+        db.columns(['name', 1])
+    with pytest.raises(UnicodeEncodeError):
+        db.columns(['\udc80'])  # can not be encoded as UTF-8
+
+
+def test_nubase_columns():
+    check_columns(reactions.nubase_database, [
+                  'name', 'nubase_id', 'mass_excess', 'half_life', 'is_stable'])
+
+
+def test_pdg_columns():
+    check_columns(reactions.pdg_database, [
+                  'name', 'pdg_id', 'mass', 'width_error_upper', 'is_self_cc'])
@@ -4,6 +4,8 @@ Test element classes
 import pytest
 import reactions
 
+import helpers
+
 
 def test_nubase_element():
 
@@ -17,9 +19,10 @@ def test_nubase_element():
     assert reactions.node_type(el) == 'element'
 
     # check that empty values in C++ correspond to None in python
-    assert reactions.nubase_element('1H').half_life is None
-    assert reactions.nubase_element('1H').half_life_error is None
-    assert reactions.nubase_element('1H').half_life_from_systematics is None
+    h1 = helpers.cached_nubase_element('1H')
+    assert h1.half_life is None
+    assert h1.half_life_error is None
+    assert h1.half_life_from_systematics is None
 
     # create a custom element
     n0 = reactions.nubase_element(
@@ -29,7 +32,7 @@ def test_nubase_element():
 
     assert n0 == n1
 
-    assert str(n0) == n0.__repr__()
+    assert str(n0) == repr(n0)
 
     # all these constructors must fail
     with pytest.raises(TypeError):
@@ -41,14 +44,14 @@ def test_nubase_element():
     with pytest.raises(RuntimeError):
         reactions.nubase_element('gamma', 1, 22, nubase_id=22)
 
-    for e in reactions.nubase_database.all_elements():
+    for e in helpers.all_nubase_elements():
         # we must be able to compute all the LaTeX names
         e.latex_name
 
     # test LaTeX names
-    assert reactions.nubase_element("1H").latex_name == "\\ce{^{1}H}"
-    assert reactions.nubase_element("1n").latex_name == "\\ce{^{1}n}"
-    assert reactions.nubase_element("7Li(i)").latex_name == "\\ce{^{7i}Li}"
+    assert helpers.cached_nubase_element("1H").latex_name == "\\ce{^{1}H}"
+    assert helpers.cached_nubase_element("1n").latex_name == "\\ce{^{1}n}"
+    assert helpers.cached_nubase_element("7Li(i)").latex_name == "\\ce{^{7i}Li}"
 
     # errors accessing elements
     with pytest.raises(reactions.LookupError):
@@ -67,10 +70,11 @@ def test_pdg_element():
     assert reactions.node_type(el) == 'element'
 
     # check that empty values in C++ correspond to None in python
-    assert reactions.pdg_element('H0').width is None
-    assert reactions.pdg_element('H0').width_error_lower is None
-    assert reactions.pdg_element('H0').width_error_upper is None
-    assert reactions.pdg_element('H0').width_error is None
+    h0 = helpers.cached_pdg_element('H0')
+    assert h0.width is None
+    assert h0.width_error_lower is None
+    assert h0.width_error_upper is None
+    assert h0.width_error is None
 
     # create a custom element
     reactions.pdg_element('gamma', 1, 0, (0., 0., 0.), (0., 1.e+16, 0.), True)
@@ -81,13 +85,14 @@ def test_pdg_element():
     g0 = reactions.pdg_element(name='gamma', pdg_id=1, three_charge=0, mass_and_errors=(
         0., 0., 0.), width_and_errors=None, is_self_cc=False)
 
-    assert str(g0) == g0.__repr__()
+    assert str(g0) == repr(g0)
 
     g1 = reactions.pdg_element(name='gamma', pdg_id=1, three_charge=0,
                                mass_and_errors=None, width_and_errors=None, is_self_cc=True)
 
-    assert str(g1) == 'reactions.pdg_element(name="gamma", pdg_id=1, three_charge=0, mass_and_errors=None, width_and_errors=None, is_self_cc=True)'
-    assert str(g1) == g1.__repr__()
+    g1_repr = repr(g1)
+    assert g1_repr == 'reactions.pdg_element(name="gamma", pdg_id=1, three_charge=0, mass_and_errors=None, width_and_errors=None, is_self_cc=True)'
+    assert str(g1) == g1_repr
 
     # all these constructors must fail
     with pytest.raises(TypeError):
@@ -100,36 +105,37 @@ def test_pdg_element():
         reactions.pdg_element('gamma', 1, 22, pdg_id=22)
 
     # test the comparison operators
-    assert reactions.pdg_element('pi+') == reactions.pdg_element(+211)
-    assert reactions.pdg_element('pi+') != reactions.pdg_element('pi-')
-    assert reactions.pdg_element(+211) != reactions.pdg_element(-211)
+    assert helpers.cached_pdg_element('pi+') == helpers.cached_pdg_element(+211)
+    assert helpers.cached_pdg_element('pi+') != helpers.cached_pdg_element('pi-')
+    assert helpers.cached_pdg_element(+211) != helpers.cached_pdg_element(-211)
 
     # errors accessing elements
     with pytest.raises(reactions.LookupError):
         reactions.pdg_element('mu')
 
-    # test LaTeX names
-    assert reactions.pdg_element("K(S)0").latex_name == "K_{S}^{0}"
-    assert reactions.pdg_element("K+").latex_name == "K^{+}"
-    assert reactions.pdg_element("pi+").latex_name == "\\pi^{+}"
-    assert reactions.pdg_element("pi-").latex_name == "\\pi^{-}"
-    assert reactions.pdg_element("Lambda").latex_name == "\\Lambda"
-    assert reactions.pdg_element("eta'(958)").latex_name == "\\eta^{'}(958)"
-    assert reactions.pdg_element("a(0)(980)0").latex_name == "a_{0}(980)^{0}"
-    assert reactions.pdg_element("f(2)'(1525)").latex_name == "f_{2}^{'}(1525)"
-    assert reactions.pdg_element("Xi(c)'+").latex_name == "\\Xi_{c}^{'+}"
-    assert reactions.pdg_element(
-        "Delta(1950)~-").latex_name == "\\bar{\\Delta}(1950)^{-}"
-    assert reactions.pdg_element(
-        "K(2)*(1430)~0").latex_name == "\\bar{K}_{2}^{*}(1430)^{0}"
-    assert reactions.pdg_element(
-        "D(s2)*(2573)+").latex_name == "D_{s2}^{*}(2573)^{+}"
-
-    for e in reactions.pdg_database.all_elements():
+    for e in helpers.all_pdg_elements():
         # we must be able to compute all the LaTeX names
         e.latex_name
 
 
+@pytest.mark.parametrize('name,latex_name', [
+    ("K(S)0", "K_{S}^{0}"),
+    ("K+", "K^{+}"),
+    ("pi+", "\\pi^{+}"),
+    ("pi-", "\\pi^{-}"),
+    ("Lambda", "\\Lambda"),
+    ("eta'(958)", "\\eta^{'}(958)"),
+    ("a(0)(980)0", "a_{0}(980)^{0}"),
+    ("f(2)'(1525)", "f_{2}^{'}(1525)"),
+    ("Xi(c)'+", "\\Xi_{c}^{'+}"),
+    ("Delta(1950)~-", "\\bar{\\Delta}(1950)^{-}"),
+    ("K(2)*(1430)~0", "\\bar{K}_{2}^{*}(1430)^{0}"),
+    ("D(s2)*(2573)+", "D_{s2}^{*}(2573)^{+}"),
+])
+def test_pdg_latex_name(name, latex_name):
+    assert helpers.cached_pdg_element(name).latex_name == latex_name
+
+
 def test_string_element():
 
     el = reactions.string_element('custom')
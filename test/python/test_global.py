@@ -1,20 +1,19 @@
 """
 Test global features of the package
 """
+import reactions
 
 
 def test_package():
     """
     Access the package from python
     """
-    import reactions
-    members = set(filter(lambda s: not s.startswith('_'), dir(reactions)))
-    assert members == set(['capi'] + reactions.__all__)
+    members = frozenset(s for s in dir(reactions) if not s.startswith('_'))
+    assert members == frozenset(['capi'] + reactions.__all__)
 
 
 def test_version():
     """
     Access the version
     """
-    from reactions import __version__
-    assert bool(__version__)
+    assert bool(reactions.__version__)
@@ -9,6 +9,9 @@ def test_node_type():
     assert reactions.node_type(reactions.pdg_element('K(S)0')) == 'element'
     assert reactions.node_type(reactions.reaction()) == 'reaction'
     assert reactions.node_type(reactions.decay()) == 'decay'
+    # the names are built only once
+    assert reactions.node_type(reactions.reaction()) is reactions.node_type(
+        reactions.reaction())
 
 
 def test_is_element():
@@ -34,6 +34,7 @@ def test_reaction():
 
     # comparison operators
     assert reac == reac
+    assert not reac != reac
 
     with pytest.raises(TypeError):
         # different element kinds
@@ -77,6 +78,7 @@ def test_decay():
 
     # comparison operators
     assert reac == reac
+    assert not reac != reac
 
     with pytest.raises(TypeError):
         # different element kinds
@@ -120,3 +122,49 @@ def test_syntax():
     reactions.reaction('A -> B {C D -> E} F')
     with pytest.raises(RuntimeError):
         reactions.decay('A -> B {C D -> E} F')
+
+
+def test_check_syntax():
+
+    reactions.check_reactions(['A B -> C D', 'A -> B {C D -> E} F'])
+    reactions.check_decays(['A -> B C', 'A -> B {C -> D E}'])
+    reactions.check_reactions(['e+ e- -> gamma gamma'], kind='pdg')
+    reactions.check_decays(['K(S)0 -> pi+ pi-'], kind='pdg')
+    reactions.check_reactions(['2H 2H -> 4He'], kind='nubase')
+    reactions.check_decays(['1n -> 1H e-'], kind='nubase')
+
+    with pytest.raises(reactions.SyntaxError):
+        reactions.check_reactions(['A B -> C D', 'A ->'])
+
+    with pytest.raises(reactions.SyntaxError):
+        reactions.check_decays(['A -> B C', 'A B -> C D'])
+
+    with pytest.raises(reactions.LookupError):
+        reactions.check_decays(['K(S)0 -> pi+ unknown'], kind='pdg')
+
+    with pytest.raises(ValueError):
+        reactions.check_decays(['A -> B C'], kind='unknown')
+
+
+def test_parse():
+
+    reacs = reactions.parse_reactions(['A B -> C D', 'A -> B {C D -> E} F'])
+    assert reacs == [reactions.reaction('A B -> C D'),
+                     reactions.reaction('A -> B {C D -> E} F')]
+
+    decs = reactions.parse_decays(['K(S)0 -> pi+ pi-'], kind='pdg')
+    assert decs == [reactions.decay('K(S)0 -> pi+ pi-', kind='pdg')]
+
+    reacs = reactions.parse_reactions(['2H 2H -> 4He'], kind='nubase')
+    assert reacs == [reactions.reaction('2H 2H -> 4He', kind='nubase')]
+
+    assert reactions.parse_decays([]) == []
+
+    with pytest.raises(reactions.SyntaxError):
+        reactions.parse_reactions(['A B -> C D', 'A ->'])
+
+    with pytest.raises(reactions.LookupError):
+        reactions.parse_decays(['K(S)0 -> pi+ unknown'], kind='pdg')
+
+    with pytest.raises(ValueError):
+        reactions.parse_decays(['A -> B C'], kind='unknown')